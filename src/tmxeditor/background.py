@@ -0,0 +1,37 @@
+"""Run blocking work (TMX parse / write) on the global thread pool."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class TaskSignals(QObject):
+    """Outcome of a BackgroundTask, delivered on the thread that created it."""
+
+    finished = Signal(object)  # the callable's return value
+    failed = Signal(object)  # the exception it raised
+
+
+class BackgroundTask(QRunnable):
+    """Call ``fn(*args)`` on a worker thread and report the outcome.
+
+    Connect to ``signals`` before handing the task to
+    ``QThreadPool.start()``.  *fn* must not touch any widget.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args: Any) -> None:
+        super().__init__()
+        self.signals = TaskSignals()
+        self._fn = fn
+        self._args = args
+
+    def run(self) -> None:
+        try:
+            result = self._fn(*self._args)
+        except Exception as exc:
+            self.signals.failed.emit(exc)
+        else:
+            self.signals.finished.emit(result)
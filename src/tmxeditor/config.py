@@ -6,10 +6,18 @@ Loads/saves shortcuts and per-column font sizes from
 
 from __future__ import annotations
 
+import functools
 import importlib.resources
 import json
+import os
+import tempfile
 from pathlib import Path
 
+try:  # optional C-accelerated JSON (``pip install tmxeditor[speedups]``)
+    import orjson
+except ImportError:
+    orjson = None
+
 _USER_CONFIG_DIR = Path.home() / ".tmxeditor"
 _USER_SETTINGS_PATH = _USER_CONFIG_DIR / "settings.json"
 
@@ -17,10 +25,15 @@ _USER_SETTINGS_PATH = _USER_CONFIG_DIR / "settings.json"
 _USER_SHORTCUTS_PATH = _USER_CONFIG_DIR / "shortcuts.json"
 
 _loaded: bool = False
+_defaults: dict[str, str] | None = None  # bundled defaults, parsed once
+_json_cache: dict[Path, tuple[float, object]] = {}  # path → (mtime, parsed)
 _shortcuts: dict[str, str] = {}
 _font_sizes: dict[str, int] = {}  # "source" / "target" → pt size
 _display: dict[str, object] = {}  # "word_wrap", "column_ratio", etc.
 
+# Undo history depth; 0 means unlimited (QUndoStack semantics)
+DEFAULT_UNDO_LIMIT = 500
+
 DEFAULT_FONT_SIZE = 14
 MIN_FONT_SIZE = 8
 MAX_FONT_SIZE = 48
@@ -44,35 +57,71 @@ ACTION_LABELS: dict[str, str] = {
 }
 
 
+def _clamp_font(size: int) -> int:
+    """Clamp a font size into [MIN_FONT_SIZE, MAX_FONT_SIZE]."""
+    if size < MIN_FONT_SIZE:
+        return MIN_FONT_SIZE
+    if size > MAX_FONT_SIZE:
+        return MAX_FONT_SIZE
+    return size
+
+
+def _read_json(path: Path) -> object:
+    """Parse a JSON file, reusing the cached result while its mtime is unchanged."""
+    mtime = path.stat().st_mtime
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _json_cache[path] = (mtime, data)
+    return data
+
+
 def _load_defaults() -> dict[str, str]:
     """Load the bundled default shortcuts using importlib.resources.
 
     Works whether the package is run from source or installed as a wheel.
+    The bundled file never changes at runtime, so it is parsed only once.
+    Callers must treat the returned mapping as read-only.
     """
+    global _defaults
+    if _defaults is not None:
+        return _defaults
     try:
         ref = importlib.resources.files("tmxeditor").joinpath("default_shortcuts.json")
-        with importlib.resources.as_file(ref) as p:
-            with open(p, encoding="utf-8") as f:
-                return json.load(f)
+        _defaults = json.loads(ref.read_text(encoding="utf-8"))
     except (FileNotFoundError, TypeError):
-        return {}
+        _defaults = {}
+    return _defaults
 
 
 def _load_settings() -> dict:
     """Load the user settings file (or legacy shortcuts file)."""
-    if _USER_SETTINGS_PATH.exists():
-        with open(_USER_SETTINGS_PATH, encoding="utf-8") as f:
-            return json.load(f)
-    # Migrate from legacy shortcuts-only file
-    if _USER_SHORTCUTS_PATH.exists():
-        with open(_USER_SHORTCUTS_PATH, encoding="utf-8") as f:
-            return {"shortcuts": json.load(f)}
-    return {}
+    try:
+        return _read_json(_USER_SETTINGS_PATH)
+    except FileNotFoundError:
+        pass
+    # Migrate from legacy shortcuts-only file (once — the legacy file is
+    # removed afterwards so later starts never probe for it)
+    try:
+        user = {"shortcuts": _read_json(_USER_SHORTCUTS_PATH)}
+    except FileNotFoundError:
+        return {}
+    try:
+        _write_settings(user)
+        _USER_SHORTCUTS_PATH.unlink(missing_ok=True)
+    except OSError:
+        # Read-only or full config dir: use the legacy shortcuts as they are
+        # and retry the migration on the next start
+        return user
+    _json_cache.pop(_USER_SHORTCUTS_PATH, None)
+    return user
 
 
 def _load() -> None:
     """Load and merge default + user configs."""
-    global _shortcuts, _font_sizes, _loaded
+    global _shortcuts, _font_sizes, _display, _loaded
     defaults = _load_defaults()
     user = _load_settings()
 
@@ -89,12 +138,13 @@ def _load() -> None:
     if "font_sizes" in user:
         for key in ("source", "target"):
             if key in user["font_sizes"]:
-                _font_sizes[key] = max(MIN_FONT_SIZE, min(MAX_FONT_SIZE, user["font_sizes"][key]))
+                _font_sizes[key] = _clamp_font(user["font_sizes"][key])
 
     # Display settings
     _display = {
         "word_wrap": True,
         "column_ratio": 0.5,
+        "undo_limit": DEFAULT_UNDO_LIMIT,
     }
     if "display" in user:
         _display.update(user["display"])
@@ -102,16 +152,45 @@ def _load() -> None:
     _loaded = True
 
 
+def _write_settings(data: dict) -> None:
+    """Atomically write *data* as the user settings file.
+
+    The JSON is serialized in memory, written with a single ``os.write``
+    to a temp file, then swapped into place with ``os.replace()`` so a
+    crash never leaves a truncated settings file behind.
+    """
+    _USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        data_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        data_bytes = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=str(_USER_CONFIG_DIR), suffix=".json.tmp"
+    )
+    try:
+        os.write(fd, data_bytes)
+        os.close(fd)
+        fd = -1  # mark as closed
+        os.replace(tmp_path, str(_USER_SETTINGS_PATH))
+    except BaseException:
+        if fd >= 0:
+            os.close(fd)
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _json_cache.pop(_USER_SETTINGS_PATH, None)
+
+
 def save_settings() -> None:
     """Persist current shortcuts and font sizes to disk."""
-    _USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    data = {
+    _write_settings({
         "shortcuts": _shortcuts,
         "font_sizes": _font_sizes,
         "display": _display,
-    }
-    with open(_USER_SETTINGS_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    })
 
 
 def get_shortcuts() -> dict[str, str]:
@@ -121,15 +200,42 @@ def get_shortcuts() -> dict[str, str]:
     return _shortcuts
 
 
+@functools.lru_cache(maxsize=64)
 def get_shortcut(action: str) -> str:
-    """Return the key-sequence string for *action*, or empty string."""
+    """Return the key-sequence string for *action*, or empty string.
+
+    Memoized; the cache is cleared whenever the mapping changes.
+    """
     return get_shortcuts().get(action, "")
 
 
+@functools.lru_cache(maxsize=64)
+def parse_shortcut(text: str):
+    """Return the ``QKeySequence`` for a portable shortcut string (memoized).
+
+    Keyed by the string itself, so the cache never goes stale when the
+    mapping changes.
+    """
+    from PySide6.QtGui import QKeySequence  # keep config importable without Qt
+
+    return QKeySequence(text)
+
+
+def get_keysequence(action: str):
+    """Return the parsed ``QKeySequence`` for *action*."""
+    return parse_shortcut(get_shortcut(action))
+
+
+def _clear_shortcut_caches() -> None:
+    get_shortcut.cache_clear()
+
+
 def set_shortcuts(mapping: dict[str, str]) -> None:
     """Update the shortcut mapping in memory."""
-    global _shortcuts
+    if not _loaded:
+        _load()
     _shortcuts.update(mapping)
+    _clear_shortcut_caches()
 
 
 def get_font_size(column: str) -> int:
@@ -143,12 +249,13 @@ def set_font_size(column: str, size: int) -> None:
     """Set font size for 'source' or 'target' column."""
     if not _loaded:
         _load()
-    _font_sizes[column] = max(MIN_FONT_SIZE, min(MAX_FONT_SIZE, size))
+    _font_sizes[column] = _clamp_font(size)
 
 
 def reload() -> None:
     """Force re-read of config files."""
     _load()
+    _clear_shortcut_caches()
 
 
 def get_display(key: str, default=None):
@@ -3,22 +3,15 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeySequence
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
     QDialogButtonBox,
-    QFormLayout,
-    QGroupBox,
     QHBoxLayout,
-    QKeySequenceEdit,
     QLabel,
     QLineEdit,
     QMessageBox,
     QPushButton,
-    QScrollArea,
-    QSpinBox,
-    QTabWidget,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -44,22 +37,14 @@ class EditDialog(QDialog):
         cursor_position: int | None = None,
     ):
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setMinimumSize(600, 300)
-        self.result_text: str | None = None
 
         layout = QVBoxLayout(self)
 
         self._editor = QTextEdit()
-        self._editor.setPlainText(text)
         self._editor.setAcceptRichText(False)
         layout.addWidget(self._editor)
 
-        if cursor_position is not None:
-            cursor = self._editor.textCursor()
-            cursor.setPosition(min(cursor_position, len(text)))
-            self._editor.setTextCursor(cursor)
-
         buttons = QDialogButtonBox(
             QDialogButtonBox.Ok | QDialogButtonBox.Cancel
         )
@@ -67,6 +52,24 @@ class EditDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        self.reset(text, title, cursor_position=cursor_position)
+
+    def reset(
+        self,
+        text: str,
+        title: str = "Edit Segment",
+        *,
+        cursor_position: int | None = None,
+    ) -> None:
+        """Load *text* so the dialog can be reused for another cell."""
+        self.setWindowTitle(title)
+        self.result_text = None
+        self._editor.setPlainText(text)
+        if cursor_position is not None:
+            cursor = self._editor.textCursor()
+            cursor.setPosition(min(cursor_position, len(text)))
+            self._editor.setTextCursor(cursor)
+
     def _accept(self) -> None:
         self.result_text = self._editor.toPlainText()
         self.accept()
@@ -88,9 +91,7 @@ class SplitDialog(QDialog):
 
     def __init__(self, text: str, title: str = "Position cursor to split", parent=None):
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setMinimumSize(600, 250)
-        self.split_position: int | None = None
 
         layout = QVBoxLayout(self)
 
@@ -98,13 +99,11 @@ class SplitDialog(QDialog):
         layout.addWidget(hint)
 
         self._editor = QTextEdit()
-        self._editor.setPlainText(text)
         self._editor.setAcceptRichText(False)
         self._editor.setReadOnly(False)  # writable so cursor blinks; _revert_text prevents actual changes
         layout.addWidget(self._editor)
 
         # Prevent actual text changes (we only want cursor positioning)
-        self._original_text = text
         self._editor.textChanged.connect(self._revert_text)
 
         buttons = QDialogButtonBox(
@@ -114,9 +113,22 @@ class SplitDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        self.reset(text, title)
+
+    def reset(self, text: str, title: str = "Position cursor to split") -> None:
+        """Load *text* so the dialog can be reused for another cell."""
+        self.setWindowTitle(title)
+        self.split_position = None
+        self._original_text = text
+        self._editor.setPlainText(text)
+
     def _revert_text(self) -> None:
-        """If the user types, revert to original text preserving cursor pos."""
-        if self._editor.toPlainText() != self._original_text:
+        """If the user types, revert to original text preserving cursor pos.
+
+        ``setPlainText`` clears the document's modified flag, so the flag
+        alone tells us whether the text differs — no full-text compare.
+        """
+        if self._editor.document().isModified():
             pos = self._editor.textCursor().position()
             self._editor.blockSignals(True)
             self._editor.setPlainText(self._original_text)
@@ -200,6 +212,17 @@ class SettingsDialog(QDialog):
     """
 
     def __init__(self, parent=None):
+        # Settings-only widgets are imported here so typical sessions
+        # never pay for them at startup.
+        from PySide6.QtWidgets import (
+            QFormLayout,
+            QGroupBox,
+            QKeySequenceEdit,
+            QScrollArea,
+            QSpinBox,
+            QTabWidget,
+        )
+
         from tmxeditor import config  # deferred to avoid circular import
 
         super().__init__(parent)
@@ -231,13 +254,9 @@ class SettingsDialog(QDialog):
         form.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
 
         self._shortcut_edits: dict[str, QKeySequenceEdit] = {}
-        current_shortcuts = config.get_shortcuts()
 
         for action_id, label in config.ACTION_LABELS.items():
             edit = QKeySequenceEdit()
-            current = current_shortcuts.get(action_id, "")
-            if current:
-                edit.setKeySequence(QKeySequence(current))
             self._shortcut_edits[action_id] = edit
             form.addRow(label + ":", edit)
 
@@ -260,17 +279,27 @@ class SettingsDialog(QDialog):
 
         self._source_font_spin = QSpinBox()
         self._source_font_spin.setRange(config.MIN_FONT_SIZE, config.MAX_FONT_SIZE)
-        self._source_font_spin.setValue(config.get_font_size("source"))
         self._source_font_spin.setSuffix(" pt")
         font_form.addRow("Source column:", self._source_font_spin)
 
         self._target_font_spin = QSpinBox()
         self._target_font_spin.setRange(config.MIN_FONT_SIZE, config.MAX_FONT_SIZE)
-        self._target_font_spin.setValue(config.get_font_size("target"))
         self._target_font_spin.setSuffix(" pt")
         font_form.addRow("Target column:", self._target_font_spin)
 
         display_layout.addWidget(font_group)
+
+        history_group = QGroupBox("Undo History")
+        history_form = QFormLayout(history_group)
+
+        self._undo_limit_spin = QSpinBox()
+        self._undo_limit_spin.setRange(0, 100_000)
+        self._undo_limit_spin.setSingleStep(100)
+        self._undo_limit_spin.setSpecialValueText("Unlimited")
+        self._undo_limit_spin.setSuffix(" steps")
+        history_form.addRow("Keep at most:", self._undo_limit_spin)
+
+        display_layout.addWidget(history_group)
         display_layout.addStretch()
 
         tabs.addTab(display_tab, "Display")
@@ -283,13 +312,31 @@ class SettingsDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        self.reset()
+
+    def reset(self) -> None:
+        """Load the current settings into the fields (before each show)."""
+        config = self._config
+        current_shortcuts = config.get_shortcuts()
+        for action_id, edit in self._shortcut_edits.items():
+            current = current_shortcuts.get(action_id, "")
+            if current:
+                edit.setKeySequence(config.parse_shortcut(current))
+            else:
+                edit.clear()
+        self._source_font_spin.setValue(config.get_font_size("source"))
+        self._target_font_spin.setValue(config.get_font_size("target"))
+        self._undo_limit_spin.setValue(
+            config.get_display("undo_limit", config.DEFAULT_UNDO_LIMIT)
+        )
+
     def _reset_shortcuts(self) -> None:
         """Reset all shortcut fields to built-in defaults."""
         defaults = self._config._load_defaults()
         for action_id, edit in self._shortcut_edits.items():
             default_seq = defaults.get(action_id, "")
             if default_seq:
-                edit.setKeySequence(QKeySequence(default_seq))
+                edit.setKeySequence(self._config.parse_shortcut(default_seq))
             else:
                 edit.clear()
 
@@ -305,6 +352,7 @@ class SettingsDialog(QDialog):
         # Collect font sizes
         self._config.set_font_size("source", self._source_font_spin.value())
         self._config.set_font_size("target", self._target_font_spin.value())
+        self._config.set_display("undo_limit", self._undo_limit_spin.value())
 
         # Persist to disk
         self._config.save_settings()
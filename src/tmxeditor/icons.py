@@ -0,0 +1,50 @@
+"""Shared application icons.
+
+Icons are built on first request and reused afterwards, so each
+resource is decoded once per process.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QTransform
+
+_RESOURCES_DIR = Path(__file__).parent / "resources"
+
+_app_icon: QIcon | None = None
+
+# Theme icons keyed by (name, rotation in degrees)
+_ICON_CACHE: dict[tuple[str, int], QIcon] = {}
+
+
+def app_icon() -> QIcon:
+    """Return the application icon (a null QIcon if the resource is missing)."""
+    global _app_icon
+    if _app_icon is None:
+        _app_icon = QIcon(str(_RESOURCES_DIR / "app_icon.svg"))
+    return _app_icon
+
+
+def theme_icon(name: str, rotation: int = 0) -> QIcon:
+    """Return the theme icon *name*, optionally rotated by *rotation* degrees."""
+    key = (name, rotation)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = QIcon.fromTheme(name)
+        if rotation:
+            icon = _rotated(icon, rotation)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+def _rotated(icon: QIcon, degrees: int) -> QIcon:
+    """Return a rotated copy of the given icon."""
+    # Render at 2x for Retina displays
+    size = 32
+    pixmap = icon.pixmap(size, size)
+    transform = QTransform().rotate(degrees)
+    # Right-angle turns map pixels exactly; only other angles need filtering
+    mode = Qt.FastTransformation if degrees % 90 == 0 else Qt.SmoothTransformation
+    return QIcon(pixmap.transformed(transform, mode))
@@ -2,86 +2,68 @@
 
 from __future__ import annotations
 
+import os
+import stat
 import sys
-from pathlib import Path
 
 
 def main() -> None:
-    from PySide6.QtGui import QIcon
+    from PySide6.QtCore import QTimer
     from PySide6.QtWidgets import QApplication
-    from PySide6.QtCore import QEvent
+    from tmxeditor.icons import app_icon
     from tmxeditor.main_window import MainWindow
 
-    class TMXApplication(QApplication):
-        def __init__(self, argv, window):
-            super().__init__(argv)
-            self.main_window = window
-
-        def event(self, event: QEvent) -> bool:
-            # Handle macOS "File Open" events (e.g., double-clicking in Finder)
-            if event.type() == QEvent.Type.FileOpen:
-                file_path = event.file()
-                if file_path:
-                    self.main_window.load_file(file_path)
-                    self.main_window.raise_()
-                    self.main_window.activateWindow()
-                return True
-            return super().event(event)
-
-    # Initialize the MainWindow first so our application layer can reference it.
-    # Note: QApplication must be instantiated before any QWidget.
-    # We do a two-step initialization of the app object.
-    
-    # 1. Create a base QApplication just enough to init the Qt GUI system
+    # QApplication must be instantiated before any QWidget.
     app = QApplication.instance()
     if app is None:
-        # Standard sys.argv is passed, but we'll re-init shortly
         app = QApplication(sys.argv)
-        app_created_here = True
-    else:
-        app_created_here = False
-        
+
     app.setApplicationName("TMX Alignment Editor")
     app.setOrganizationName("TMXEditor")
 
-    # Set app icon (dock / taskbar / window)
-    icon_path = Path(__file__).parent / "resources" / "app_icon.svg"
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
-
-    # We need a custom Application to handle macOS FileOpen events natively
-    # PySide6 allows replacing the current 'instance' object loop behavior
-    # if it hasn't started yet, but a cleaner way is to simply intercept events on the app instance.
-    
     window = MainWindow()
-    
-    from PySide6.QtCore import QObject
-    
-    # macOS: Install an event filter on the QApplication
-    # This is a safer alternative to subclassing QApplication when testing/embedded
-    class MacFileOpenFilter(QObject):
-        def eventFilter(self, obj, event):
-            if event.type() == QEvent.Type.FileOpen:
-                file_path = event.file()
-                if file_path:
-                    window.load_file(file_path)
-                    window.raise_()
-                    window.activateWindow()
-                return True
-            return False
-            
-    # Keep reference to avoid garbage collection
-    mac_filter = MacFileOpenFilter()
-    app.installEventFilter(mac_filter)
+
+    if sys.platform == "darwin":
+        from PySide6.QtCore import QEvent, QObject
+
+        # macOS: "File Open" events (e.g., double-clicking in Finder) are
+        # delivered to the QApplication — intercept them with an event filter.
+        class MacFileOpenFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.FileOpen:
+                    file_path = event.file()
+                    if file_path:
+                        window.load_file(file_path)
+                        window.raise_()
+                        window.activateWindow()
+                    return True
+                return False
+
+        # Parent to the app to keep a reference (avoids garbage collection)
+        app.installEventFilter(MacFileOpenFilter(app))
+
+    window.show()
+
+    def set_app_icon() -> None:
+        """Set the app icon (dock / taskbar / window)."""
+        icon = app_icon()
+        if not icon.isNull():
+            app.setWindowIcon(icon)
+
+    # Decode the SVG icon after the first frame rather than before it
+    QTimer.singleShot(0, set_app_icon)
 
     # Windows / CLI: Check command line arguments
     if len(sys.argv) > 1:
         # sys.argv[0] is the script name, sys.argv[1] is the first arg
-        target_file = Path(sys.argv[1])
-        if target_file.exists() and target_file.is_file():
-            window.load_file(str(target_file))
-
-    window.show()
+        target_file = sys.argv[1]
+        try:
+            is_regular = stat.S_ISREG(os.stat(target_file).st_mode)
+        except OSError:
+            is_regular = False
+        if is_regular:
+            # Parse on the first event-loop tick so the window paints first
+            QTimer.singleShot(0, lambda: window.load_file(target_file))
 
     sys.exit(app.exec())
 
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon, QKeySequence, QPixmap, QTransform, QUndoStack
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QAction, QKeySequence, QUndoStack
 from PySide6.QtWidgets import (
     QApplication,
+    QDialog,
     QFileDialog,
     QMainWindow,
+    QMenu,
     QMessageBox,
     QSizePolicy,
     QStatusBar,
@@ -18,12 +23,11 @@ from PySide6.QtWidgets import (
 )
 
 from tmxeditor import config
-from tmxeditor.dialogs import EditDialog, FindReplaceDialog, SettingsDialog, SplitDialog
-from tmxeditor.models import AlignmentDocument
+from tmxeditor.icons import theme_icon
 from tmxeditor.table_model import AlignmentTableModel
 from tmxeditor.table_view import AlignmentTableView
-from tmxeditor.tmx_io import parse_tmx, write_tmx
 from tmxeditor.undo import (
+    BulkEditCommand,
     DeleteEmptyRowCommand,
     EditCellCommand,
     MergeCommand,
@@ -31,8 +35,20 @@ from tmxeditor.undo import (
     SplitCommand,
 )
 
+# Dialogs and the lxml-backed TMX reader/writer are imported on first use so
+# the window can paint before they load.
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QProgressDialog
+
+    from tmxeditor.background import BackgroundTask
+    from tmxeditor.dialogs import EditDialog, FindReplaceDialog, SettingsDialog, SplitDialog
+    from tmxeditor.models import AlignmentDocument
+    from tmxeditor.search import FindIndex
+
 
 class MainWindow(QMainWindow):
+    _COL_NAMES = ("Source", "Target")
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("TMX Alignment Editor")
@@ -42,13 +58,28 @@ class MainWindow(QMainWindow):
         self._doc: AlignmentDocument | None = None
         self._dirty = False
         self._undo_stack = QUndoStack(self)
+        self._undo_index = 0  # last seen index, to tell redo from undo
+        self._in_bulk = False  # True while a bulk change does its own refresh
+        self._apply_undo_limit()
         self._find_dialog: FindReplaceDialog | None = None
+        self._find_index: FindIndex | None = None  # rebuilt lazily after edits
+        # Modal dialogs are built on first use, then reset and reused
+        self._edit_dialog: EditDialog | None = None
+        self._split_dialog: SplitDialog | None = None
+        self._settings_dialog: SettingsDialog | None = None
+        # Background open/save: the task whose result is still wanted, and
+        # every task in flight (their signals must outlive the worker run)
+        self._io_task: BackgroundTask | None = None
+        self._io_tasks: set[BackgroundTask] = set()
+        self._io_progress: QProgressDialog | None = None
 
         # Table model & view
         self._model = AlignmentTableModel(self)
         self._view = AlignmentTableView(self)
         self._view.setModel(self._model)
         self.setCentralWidget(self._view)
+        # Keyboard and mouse navigation both move the current cell
+        self._view.selectionModel().currentChanged.connect(self._update_status)
 
         # Connect inline signals from the table view
         self._view.split_at_position.connect(self._on_inline_split)
@@ -57,6 +88,13 @@ class MainWindow(QMainWindow):
         # Status bar
         self._status = QStatusBar(self)
         self.setStatusBar(self._status)
+        # Coalesce bursts of status refreshes (e.g. key repeat) to one per frame
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._do_update_status)
+        self._last_status_key: tuple | None = ()  # inputs of the shown message
+        self._doc_basename = "Untitled"  # file name shown in title/status
 
         # Menus, toolbar, shortcuts
         self._build_menus()
@@ -71,86 +109,95 @@ class MainWindow(QMainWindow):
 
     # ── Menu construction ───────────────────────────────────────
 
-    def _sc(self, action_name: str) -> str:
-        """Shortcut helper."""
-        return config.get_shortcut(action_name)
+    @staticmethod
+    def _add_action(menu: QMenu, text: str, slot) -> QAction:
+        """Add a menu action whose triggered signal is connected to *slot*."""
+        action = menu.addAction(text)
+        action.triggered.connect(slot)
+        return action
 
     def _build_menus(self) -> None:
         mb = self.menuBar()
 
         # File
         file_menu = mb.addMenu("&File")
-        self._act_open = file_menu.addAction("&Open…", self._file_open)
-        self._act_open.setShortcut(QKeySequence(self._sc("file_open")))
+        self._act_open = self._add_action(file_menu, "&Open…", self._file_open)
+        self._act_open.setShortcut(config.get_keysequence("file_open"))
 
-        self._act_save = file_menu.addAction("&Save", self._file_save)
-        self._act_save.setShortcut(QKeySequence(self._sc("file_save")))
+        self._act_save = self._add_action(file_menu, "&Save", self._file_save)
+        self._act_save.setShortcut(config.get_keysequence("file_save"))
 
-        self._act_save_as = file_menu.addAction("Save &As…", self._file_save_as)
-        self._act_save_as.setShortcut(QKeySequence(self._sc("file_save_as")))
+        self._act_save_as = self._add_action(file_menu, "Save &As…", self._file_save_as)
+        self._act_save_as.setShortcut(config.get_keysequence("file_save_as"))
 
         file_menu.addSeparator()
-        self._act_quit = file_menu.addAction("&Quit", self.close)
-        self._act_quit.setShortcut(QKeySequence(self._sc("file_quit")))
+        self._act_quit = self._add_action(file_menu, "&Quit", self.close)
+        self._act_quit.setShortcut(config.get_keysequence("file_quit"))
 
         # Edit
         edit_menu = mb.addMenu("&Edit")
         self._act_undo = self._undo_stack.createUndoAction(self, "&Undo")
-        self._act_undo.setShortcut(QKeySequence(self._sc("edit_undo")))
+        self._act_undo.setShortcut(config.get_keysequence("edit_undo"))
         edit_menu.addAction(self._act_undo)
 
         self._act_redo = self._undo_stack.createRedoAction(self, "&Redo")
-        self._act_redo.setShortcut(QKeySequence(self._sc("edit_redo")))
+        self._act_redo.setShortcut(config.get_keysequence("edit_redo"))
         edit_menu.addAction(self._act_redo)
 
         edit_menu.addSeparator()
-        self._act_find = edit_menu.addAction("&Find / Replace…", self._show_find)
-        self._act_find.setShortcut(QKeySequence(self._sc("edit_find")))
+        self._act_find = self._add_action(edit_menu, "&Find / Replace…", self._show_find)
+        self._act_find.setShortcut(config.get_keysequence("edit_find"))
 
         # Operations
         ops_menu = mb.addMenu("&Operations")
 
-        self._act_split = ops_menu.addAction("Sp&lit Cell (dialog)", self._op_split_dialog)
-        self._act_split.setShortcut(QKeySequence(self._sc("op_split")))
+        self._act_split = self._add_action(ops_menu, "Sp&lit Cell (dialog)", self._op_split_dialog)
+        self._act_split.setShortcut(config.get_keysequence("op_split"))
 
-        self._act_merge = ops_menu.addAction("&Merge with Next", self._op_merge)
-        self._act_merge.setShortcut(QKeySequence(self._sc("op_merge")))
+        self._act_merge = self._add_action(ops_menu, "&Merge with Next", self._op_merge)
+        self._act_merge.setShortcut(config.get_keysequence("op_merge"))
 
         ops_menu.addSeparator()
-        self._act_move_up = ops_menu.addAction("Move Cell &Up", self._op_move_up)
-        self._act_move_up.setShortcut(QKeySequence(self._sc("op_move_up")))
+        self._act_move_up = self._add_action(ops_menu, "Move Cell &Up", self._op_move_up)
+        self._act_move_up.setShortcut(config.get_keysequence("op_move_up"))
 
-        self._act_move_down = ops_menu.addAction("Move Cell &Down", self._op_move_down)
-        self._act_move_down.setShortcut(QKeySequence(self._sc("op_move_down")))
+        self._act_move_down = self._add_action(ops_menu, "Move Cell &Down", self._op_move_down)
+        self._act_move_down.setShortcut(config.get_keysequence("op_move_down"))
 
         ops_menu.addSeparator()
-        self._act_edit = ops_menu.addAction("&Edit Cell…", self._op_edit_cell)
-        self._act_edit.setShortcut(QKeySequence(self._sc("op_edit_cell")))
+        self._act_edit = self._add_action(ops_menu, "&Edit Cell…", self._op_edit_cell)
+        self._act_edit.setShortcut(config.get_keysequence("op_edit_cell"))
 
-        self._act_delete_empty = ops_menu.addAction("&Delete Empty Row", self._op_delete_empty_row)
-        self._act_delete_empty.setShortcut(QKeySequence(self._sc("op_delete_empty_row")))
+        self._act_delete_empty = self._add_action(
+            ops_menu, "&Delete Empty Row", self._op_delete_empty_row
+        )
+        self._act_delete_empty.setShortcut(config.get_keysequence("op_delete_empty_row"))
 
         # View
         view_menu = mb.addMenu("&View")
 
-        self._act_word_wrap = view_menu.addAction("Allow Wrapping Within Words", self._toggle_word_wrap)
+        self._act_word_wrap = self._add_action(
+            view_menu, "Allow Wrapping Within Words", self._toggle_word_wrap
+        )
         self._act_word_wrap.setCheckable(True)
         self._act_word_wrap.setChecked(config.get_display("word_wrap", True))
 
         view_menu.addSeparator()
-        self._act_font_up = view_menu.addAction("Increase Column Font", self._font_increase)
+        self._act_font_up = self._add_action(view_menu, "Increase Column Font", self._font_increase)
         self._act_font_up.setShortcut(QKeySequence("Ctrl+="))
 
-        self._act_font_down = view_menu.addAction("Decrease Column Font", self._font_decrease)
+        self._act_font_down = self._add_action(
+            view_menu, "Decrease Column Font", self._font_decrease
+        )
         self._act_font_down.setShortcut(QKeySequence("Ctrl+-"))
 
         # Settings
         view_menu.addSeparator()
-        self._act_settings = view_menu.addAction("&Settings…", self._show_settings)
+        self._act_settings = self._add_action(view_menu, "&Settings…", self._show_settings)
         self._act_settings.setShortcut(QKeySequence("Ctrl+,"))
 
     def _build_toolbar(self) -> None:
-        tb = QToolBar("Main")
+        tb = self._toolbar = QToolBar("Main")
         tb.setMovable(False)
         tb.setToolButtonStyle(Qt.ToolButtonIconOnly)
         self.addToolBar(tb)
@@ -158,7 +205,7 @@ class MainWindow(QMainWindow):
 
         # Use native SF Symbols (macOS) via QIcon.fromTheme (PySide6 6.7+)
         # Tuples: (action, sf_name, label, shortcut_key, rotation_degrees)
-        icon_actions = [
+        self._toolbar_icons = [
             (self._act_open, "folder", "Open File", "file_open", 0),
             (self._act_save, "arrow.down.doc", "Save", "file_save", 0),
             (self._act_undo, "arrow.uturn.backward", "Undo", "edit_undo", 0),
@@ -170,14 +217,13 @@ class MainWindow(QMainWindow):
             (self._act_edit, "pencil", "Edit Cell", "op_edit_cell", 0),
             (self._act_delete_empty, "delete.left", "Delete Empty Row", "op_delete_empty_row", 0),
         ]
-        for action, sf_name, label, sc_key, rotation in icon_actions:
-            icon = QIcon.fromTheme(sf_name)
-            if rotation:
-                icon = self._rotated_icon(icon, rotation)
-            action.setIcon(icon)
-            shortcut = self._mac_shortcut(self._sc(sc_key))
+        shortcuts = config.get_shortcuts()
+        for action, _sf_name, label, sc_key, _rotation in self._toolbar_icons:
+            shortcut = self._mac_shortcut(shortcuts.get(sc_key, ""))
             tip = f"{label} ({shortcut})" if shortcut else label
             action.setToolTip(tip)
+        # Theme lookups hit the icon registry / disk: let the window paint first
+        QTimer.singleShot(0, self._load_toolbar_icons)
 
         # Helper to create an expanding spacer
         def _spacer() -> QWidget:
@@ -201,17 +247,13 @@ class MainWindow(QMainWindow):
         tb.addAction(self._act_edit)
         tb.addAction(self._act_delete_empty)
 
-    @staticmethod
-    def _rotated_icon(icon: QIcon, degrees: int) -> QIcon:
-        """Return a rotated copy of the given icon."""
-        # Render at 2x for Retina displays
-        size = 32
-        pixmap = icon.pixmap(size, size)
-        transform = QTransform().rotate(degrees)
-        rotated = pixmap.transformed(transform, Qt.SmoothTransformation)
-        return QIcon(rotated)
+    def _load_toolbar_icons(self) -> None:
+        """Fill in the toolbar icons (deferred from _build_toolbar)."""
+        for action, sf_name, _label, _sc_key, rotation in self._toolbar_icons:
+            action.setIcon(theme_icon(sf_name, rotation))
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _mac_shortcut(shortcut: str) -> str:
         """Convert a Qt shortcut string to Mac symbol notation."""
         if not shortcut:
@@ -226,17 +268,31 @@ class MainWindow(QMainWindow):
     # ── Status bar ──────────────────────────────────────────────
 
     def _update_status(self) -> None:
-        if self._doc is None:
+        """Schedule a status bar refresh."""
+        self._status_timer.start()
+
+    def _do_update_status(self) -> None:
+        doc = self._doc
+        if doc is None:
+            key = None
+        else:
+            key = (
+                self._doc_basename, self._dirty, doc.row_count(),
+                doc.source_lang, doc.target_lang,
+                self._view.current_row(), self._view.current_col(),
+            )
+        # Nothing shown has changed: skip formatting and the repaint
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        if key is None:
             self._status.showMessage("No file loaded")
             return
-        path = self._doc.file_path or "Untitled"
-        rows = self._doc.row_count()
-        langs = f"{self._doc.source_lang} → {self._doc.target_lang}"
-        dirty_mark = " •" if self._dirty else ""
-        row = self._view.current_row() + 1 if self._view.current_row() >= 0 else 0
-        col_name = "Source" if self._view.current_col() == 0 else "Target"
+        basename, dirty, rows, src, tgt, row, col = key
+        dirty_mark = " •" if dirty else ""
         self._status.showMessage(
-            f"{Path(path).name}{dirty_mark}  |  {rows} rows  |  {langs}  |  Row {row} · {col_name}"
+            f"{basename}{dirty_mark}  |  {rows} rows  |  {src} → {tgt}"
+            f"  |  Row {row + 1} · {self._COL_NAMES[col]}"
         )
 
     def _on_clean_changed(self, clean: bool) -> None:
@@ -244,15 +300,43 @@ class MainWindow(QMainWindow):
         self._update_title()
         self._update_status()
 
-    def _on_undo_redo(self, _idx: int) -> None:
+    def _on_undo_redo(self, idx: int) -> None:
         """Refresh the view after any undo/redo operation."""
-        self._model.notify_data_changed()
+        # indexChanged also fires on push, so this covers every edit
+        last, self._undo_index = self._undo_index, idx
+        if self._in_bulk:
+            self._find_index = None
+            return
+        cmd = None
+        stack = self._undo_stack
+        if idx == last + 1:
+            cmd = stack.command(idx - 1)  # pushed or redone
+        elif idx == last and stack.count() == stack.undoLimit():
+            # At the undo limit a push drops the oldest command, so the
+            # index stays put while the new command lands on top
+            cmd = stack.command(idx - 1)
+        elif idx == last - 1:
+            cmd = stack.command(idx)  # undone
+        # Inserted/removed rows were already signalled by the document
+        if hasattr(cmd, "affected_cells"):
+            cells = cmd.affected_cells()
+            self._model.notify_cells_changed(cells)
+            # Patch the Find index in place unless rows came or went
+            if self._find_index is not None and not self._find_index.refresh_cells(cells):
+                self._find_index = None
+        else:
+            self._model.notify_data_changed()
+            self._find_index = None
         self._update_status()
 
     def _update_title(self) -> None:
-        name = Path(self._doc.file_path).name if self._doc and self._doc.file_path else "Untitled"
         dirty = " \u2022" if self._dirty else ""
-        self.setWindowTitle(f"{name}{dirty}")
+        self.setWindowTitle(f"{self._doc_basename}{dirty}")
+
+    def _set_file_path(self, path: str | None) -> None:
+        """Record the document's path and cache its display name."""
+        self._doc.file_path = path
+        self._doc_basename = Path(path).name if path else "Untitled"
 
     # ── File operations ─────────────────────────────────────────
 
@@ -279,24 +363,42 @@ class MainWindow(QMainWindow):
             return
         self.load_file(path)
 
-    def load_file(self, path: str | Path) -> bool:
-        """Load a TMX file and return True on success. Can be called externally."""
-        try:
-            doc = parse_tmx(path)
-        except Exception as exc:
-            QMessageBox.critical(self, "Open failed", f"Could not open file:\n{exc}")
-            return False
-            
+    def load_file(self, path: str | Path) -> None:
+        """Load a TMX file in the background. Can be called externally."""
+        from tmxeditor.tmx_io import parse_tmx
+
+        if self._io_task is not None:
+            return
+        self._start_io(
+            f"Opening {Path(path).name}…",
+            parse_tmx,
+            path,
+            on_finished=self._on_file_loaded,
+            on_failed=lambda exc: QMessageBox.critical(
+                self, "Open failed", f"Could not open file:\n{exc}"
+            ),
+            cancellable=True,
+        )
+
+    def _on_file_loaded(self, doc: AlignmentDocument) -> None:
         self._doc = doc
+        self._set_file_path(doc.file_path)
+        self._find_index = None
+        # Dropping the old history emits indexChanged; skip that refresh,
+        # since set_document() below resets the view once anyway.
+        self._in_bulk = True
+        try:
+            self._undo_stack.clear()
+        finally:
+            self._in_bulk = False
         self._model.set_document(doc)
-        self._undo_stack.clear()
+        self._apply_undo_limit()
         self._undo_stack.setClean()
         self._dirty = False
         self._update_title()
         self._update_status()
         if doc.row_count() > 0:
             self._view.select_cell(0, 0)
-        return True
 
     def _file_save(self) -> None:
         if self._doc is None:
@@ -314,20 +416,107 @@ class MainWindow(QMainWindow):
         )
         if not path:
             return
-        self._doc.file_path = path
+        self._set_file_path(path)
         self._do_save(path)
 
     def _do_save(self, path: str) -> None:
-        try:
-            write_tmx(self._doc, path)
-        except Exception as exc:
-            QMessageBox.critical(self, "Save failed", str(exc))
-            return
+        from tmxeditor.tmx_io import write_tmx
+
+        # Not cancellable: the editor stays locked until the file is written,
+        # so the document cannot change under the writer thread
+        self._start_io(
+            f"Saving {Path(path).name}…",
+            write_tmx,
+            self._doc,
+            path,
+            on_finished=self._on_file_saved,
+            on_failed=lambda exc: QMessageBox.critical(self, "Save failed", str(exc)),
+        )
+
+    def _on_file_saved(self, _result: None) -> None:
         self._undo_stack.setClean()
         self._dirty = False
         self._update_title()
         self._update_status()
 
+    # ── Background file I/O ─────────────────────────────────────
+
+    def _start_io(
+        self, label: str, fn, *args, on_finished, on_failed, cancellable: bool = False
+    ) -> None:
+        """Run *fn* on the thread pool with the editor locked and a progress dialog.
+
+        *on_finished* / *on_failed* run on the UI thread, unless the user
+        cancelled first, in which case the result is dropped.
+        """
+        from PySide6.QtCore import QThreadPool
+        from PySide6.QtWidgets import QProgressDialog
+
+        from tmxeditor.background import BackgroundTask
+
+        task = BackgroundTask(fn, *args)
+        self._io_task = task
+        self._io_tasks.add(task)
+
+        def finished(result) -> None:
+            if self._end_io(task):
+                on_finished(result)
+
+        def failed(exc: Exception) -> None:
+            if self._end_io(task):
+                on_failed(exc)
+
+        task.signals.finished.connect(finished)
+        task.signals.failed.connect(failed)
+
+        # Menus, toolbar and table are disabled at once; the dialog itself
+        # only appears for loads/saves that take noticeable time
+        self._set_io_busy(True)
+        progress = QProgressDialog(self)
+        progress.setLabelText(label)
+        progress.setRange(0, 0)  # busy indicator: the parser reports no progress
+        if cancellable:
+            progress.canceled.connect(self._cancel_io)
+        else:
+            progress.setCancelButton(None)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(400)
+        progress.setValue(0)  # starts the minimum-duration timer
+        self._io_progress = progress
+
+        QThreadPool.globalInstance().start(task)
+
+    def _end_io(self, task: BackgroundTask) -> bool:
+        """Forget a finished *task*; return True if its result is still wanted."""
+        self._io_tasks.discard(task)
+        if task is not self._io_task:
+            return False
+        self._io_task = None
+        self._close_io_progress()
+        return True
+
+    def _cancel_io(self) -> None:
+        """Stop waiting for the running open; the worker's result is discarded."""
+        self._io_task = None
+        self._close_io_progress()
+
+    def _close_io_progress(self) -> None:
+        if self._io_progress is not None:
+            # hide(), not close(): closing a progress dialog emits canceled
+            self._io_progress.hide()
+            self._io_progress.deleteLater()
+            self._io_progress = None
+        self._set_io_busy(False)
+
+    def _set_io_busy(self, busy: bool) -> None:
+        # Disabled menu bar and toolbar also silence their action shortcuts
+        for widget in (self.menuBar(), self._toolbar, self._view):
+            widget.setEnabled(not busy)
+        # Find/Replace is non-modal: a replace mid-save would edit the
+        # document under the writer and then be marked clean
+        if self._find_dialog is not None:
+            self._find_dialog.setEnabled(not busy)
+
     # ── Inline signals from table view ──────────────────────────
 
     def _on_inline_split(self, row: int, col: int, pos: int) -> None:
@@ -344,7 +533,8 @@ class MainWindow(QMainWindow):
 
     def _on_inline_edit(self, row: int, col: int, old_text: str, new_text: str) -> None:
         """Called when user confirms an inline text edit (F2 → type → Enter)."""
-        if self._doc is None:
+        # Enter without typing: no undo step, no repaint
+        if self._doc is None or new_text == old_text:
             return
         cmd = EditCellCommand(self._doc, row, col, old_text, new_text)
         self._push_cmd(cmd)
@@ -359,10 +549,8 @@ class MainWindow(QMainWindow):
         return True
 
     def _push_cmd(self, cmd) -> None:
-        """Push an undo command, then refresh the view."""
+        """Push an undo command; _on_undo_redo refreshes the view."""
         self._undo_stack.push(cmd)
-        self._model.notify_data_changed()
-        self._update_status()
 
     def _op_split_dialog(self) -> None:
         """Split via dialog (for users who prefer the modal approach)."""
@@ -375,8 +563,14 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Split", "Cell is empty — nothing to split.")
             return
 
-        dlg = SplitDialog(text, parent=self)
-        if dlg.exec() != SplitDialog.Accepted:
+        if self._split_dialog is None:
+            from tmxeditor.dialogs import SplitDialog
+
+            self._split_dialog = SplitDialog(text, parent=self)
+        else:
+            self._split_dialog.reset(text)
+        dlg = self._split_dialog
+        if dlg.exec() != QDialog.Accepted:
             return
         pos = dlg.split_position
         if pos is None:
@@ -431,9 +625,16 @@ class MainWindow(QMainWindow):
         row = self._view.current_row()
         col = self._view.current_col()
         old_text = self._doc.get_cell(row, col)
-        col_name = "Source" if col == 0 else "Target"
-        dlg = EditDialog(old_text, title=f"Edit {col_name} — Row {row + 1}", parent=self)
-        if dlg.exec() != EditDialog.Accepted:
+        col_name = self._COL_NAMES[col]
+        title = f"Edit {col_name} — Row {row + 1}"
+        if self._edit_dialog is None:
+            from tmxeditor.dialogs import EditDialog
+
+            self._edit_dialog = EditDialog(old_text, title=title, parent=self)
+        else:
+            self._edit_dialog.reset(old_text, title)
+        dlg = self._edit_dialog
+        if dlg.exec() != QDialog.Accepted:
             return
         new_text = dlg.result_text
         if new_text is None or new_text == old_text:
@@ -466,6 +667,8 @@ class MainWindow(QMainWindow):
 
     def _show_find(self) -> None:
         if self._find_dialog is None:
+            from tmxeditor.dialogs import FindReplaceDialog
+
             self._find_dialog = FindReplaceDialog(self)
             self._find_dialog.btn_next.clicked.connect(self._find_next)
             self._find_dialog.btn_prev.clicked.connect(self._find_prev)
@@ -475,10 +678,18 @@ class MainWindow(QMainWindow):
         self._find_dialog.raise_()
         self._find_dialog.find_field.setFocus()
 
-    def _find_match(self, text: str, query: str, case_sensitive: bool) -> int:
-        if not case_sensitive:
-            return text.lower().find(query.lower())
-        return text.find(query)
+    def _get_find_index(self) -> FindIndex:
+        """Return the find index, building it after loads and structural edits."""
+        if self._find_index is None:
+            from tmxeditor.search import FindIndex
+
+            self._find_index = FindIndex(self._doc)
+        return self._find_index
+
+    @staticmethod
+    def _query_pattern(query: str, case_sensitive: bool) -> re.Pattern[str]:
+        """Compile *query* as literal text (the re module caches compiled patterns)."""
+        return re.compile(re.escape(query), 0 if case_sensitive else re.IGNORECASE)
 
     def _find_next(self) -> None:
         self._do_find(forward=True)
@@ -493,40 +704,22 @@ class MainWindow(QMainWindow):
         if not query:
             return
         case = self._find_dialog.case_sensitive.isChecked()
-        start_row = max(self._view.current_row(), 0)
-        start_col = self._view.current_col()
-        n = self._doc.row_count()
-        step = 1 if forward else -1
-        col = start_col + step
-        row = start_row
-        if col > 1:
-            col = 0
-            row += step
-        elif col < 0:
-            col = 1
-            row += step
-
-        checked = 0
-        while checked < n * 2:
-            r = row % n
-            if r < 0:
-                r += n
-            c = col % 2
-            text = self._doc.get_cell(r, c)
-            if self._find_match(text, query, case) >= 0:
-                self._view.select_cell(r, c)
-                self._update_status()
-                return
-            col += step
-            if (forward and col > 1) or (not forward and col < 0):
-                col = 0 if forward else 1
-                row += step
-            checked += 1
+        hit = self._get_find_index().find(
+            query,
+            max(self._view.current_row(), 0),
+            self._view.current_col(),
+            forward=forward,
+            case_sensitive=case,
+        )
+        if hit is not None:
+            self._view.select_cell(*hit)
+            self._update_status()
+            return
 
         QMessageBox.information(self, "Find", f"'{query}' not found.")
 
     def _replace_one(self) -> None:
-        if self._doc is None or self._find_dialog is None:
+        if self._doc is None or self._find_dialog is None or self._io_task is not None:
             return
         query = self._find_dialog.find_field.text()
         replacement = self._find_dialog.replace_field.text()
@@ -538,92 +731,98 @@ class MainWindow(QMainWindow):
             return
         case = self._find_dialog.case_sensitive.isChecked()
         text = self._doc.get_cell(row, col)
-        idx = self._find_match(text, query, case)
-        if idx < 0:
+        # Case-insensitive search on the cell itself: no lowered copies, and
+        # the match span is exact even where lower() would change lengths
+        match = self._query_pattern(query, case).search(text)
+        if match is None:
             self._find_next()
             return
-        new_text = text[:idx] + replacement + text[idx + len(query):]
+        new_text = text[:match.start()] + replacement + text[match.end():]
         cmd = EditCellCommand(self._doc, row, col, text, new_text)
         self._push_cmd(cmd)
         self._find_next()
 
     def _replace_all(self) -> None:
-        if self._doc is None or self._find_dialog is None:
+        if self._doc is None or self._find_dialog is None or self._io_task is not None:
             return
         query = self._find_dialog.find_field.text()
         replacement = self._find_dialog.replace_field.text()
         if not query:
             return
         case = self._find_dialog.case_sensitive.isChecked()
+        pattern = self._query_pattern(query, case)
+        # The replacement is literal text, not a template
+        literal = replacement.replace("\\", "\\\\")
+        # The find index locates the matching cells in one scan; only those
+        # are rewritten, and the edits are pushed below as one command
+        edits = []
         count = 0
-        # Group all replacements into a single undo step
-        self._undo_stack.beginMacro("Replace All")
-        for r in range(self._doc.row_count()):
-            for c in range(2):
-                text = self._doc.get_cell(r, c)
-                if case:
-                    if query in text:
-                        new_text = text.replace(query, replacement)
-                        cmd = EditCellCommand(self._doc, r, c, text, new_text)
-                        self._undo_stack.push(cmd)
-                        count += 1
-                else:
-                    lower_text = text.lower()
-                    lower_query = query.lower()
-                    if lower_query in lower_text:
-                        new_text = text
-                        idx = lower_text.find(lower_query)
-                        while idx >= 0:
-                            new_text = new_text[:idx] + replacement + new_text[idx + len(query):]
-                            lower_text = new_text.lower()
-                            idx = lower_text.find(lower_query, idx + len(replacement))
-                        cmd = EditCellCommand(self._doc, r, c, text, new_text)
-                        self._undo_stack.push(cmd)
-                        count += 1
-        self._undo_stack.endMacro()
-        if count > 0:
-            self._model.notify_data_changed()
-            self._update_status()
+        get_cell = self._doc.get_cell
+        subn = pattern.subn
+        for r, c in self._get_find_index().matching_cells(pattern):
+            text = get_cell(r, c)
+            new_text, n = subn(literal, text)
+            if n:
+                edits.append((r, c, text, new_text))
+                count += n
+        # All replacements form a single undo step
+        if edits:
+            self._push_cmd(
+                BulkEditCommand(self._doc, edits, description=f"Replace '{query}'")
+            )
         QMessageBox.information(
-            self, "Replace All", f"Replaced in {count} cell(s)."
+            self, "Replace All", f"Replaced {count} occurrence(s) in {len(edits)} cell(s)."
         )
 
     # ── Overrides ───────────────────────────────────────────────
 
     def closeEvent(self, event) -> None:
+        if self._io_task is not None:
+            event.ignore()
+            return
         if self._confirm_discard():
             event.accept()
         else:
             event.ignore()
 
-    def keyPressEvent(self, event) -> None:
-        """Update status bar on navigation."""
-        super().keyPressEvent(event)
-        self._update_status()
-
     # ── Settings & Font Size ────────────────────────────────────
 
     def _show_settings(self) -> None:
-        dlg = SettingsDialog(self)
-        if dlg.exec() == SettingsDialog.Accepted:
+        if self._settings_dialog is None:
+            from tmxeditor.dialogs import SettingsDialog
+
+            self._settings_dialog = SettingsDialog(self)
+        else:
+            self._settings_dialog.reset()
+        if self._settings_dialog.exec() == QDialog.Accepted:
             self._apply_settings()
 
     def _apply_settings(self) -> None:
         """Re-apply settings after the Settings dialog changes them."""
         # Refresh the table to pick up new font sizes
         self._model.notify_data_changed()
-        self._view._apply_word_wrap()
+        self._view.apply_display_settings()
         self._view.viewport().update()
+        self._apply_undo_limit()
         self._update_status()
         # Note: shortcut changes require restart for menu accelerators
         # (the Settings dialog saves to disk; they take effect next launch)
 
+    def _apply_undo_limit(self) -> None:
+        """Cap the undo history at the configured depth."""
+        # QUndoStack only accepts a new limit while it is empty; otherwise
+        # the setting takes effect when the next file is opened.
+        if self._undo_stack.count() == 0:
+            self._undo_stack.setUndoLimit(
+                config.get_display("undo_limit", config.DEFAULT_UNDO_LIMIT)
+            )
+
     def _toggle_word_wrap(self) -> None:
         """Toggle word wrap on/off and persist the setting."""
         wrap = self._act_word_wrap.isChecked()
         config.set_display("word_wrap", wrap)
         config.save_settings()
-        self._view._apply_word_wrap()
+        self._view.apply_display_settings()
         self._model.notify_data_changed()
 
     def _font_increase(self) -> None:
@@ -633,6 +832,7 @@ class MainWindow(QMainWindow):
         current = config.get_font_size(col_name)
         config.set_font_size(col_name, current + 1)
         config.save_settings()
+        self._view.apply_display_settings()
         self._model.notify_data_changed()
         self._view.select_cell(row, col)
 
@@ -643,5 +843,6 @@ class MainWindow(QMainWindow):
         current = config.get_font_size(col_name)
         config.set_font_size(col_name, current - 1)
         config.save_settings()
+        self._view.apply_display_settings()
         self._model.notify_data_changed()
         self._view.select_cell(row, col)
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from lxml import etree
 
 
-@dataclass
+class RowListener(Protocol):
+    """Receives structural changes (implemented by the Qt table model).
+
+    The ``begin_*`` call comes before the rows list changes and the
+    ``end_*`` call after, as Qt's begin/end row signals require.
+    """
+
+    def begin_insert_row(self, index: int) -> None: ...
+    def end_insert_row(self) -> None: ...
+    def begin_remove_row(self, index: int) -> None: ...
+    def end_remove_row(self) -> None: ...
+
+
+@dataclass(slots=True)
 class AlignmentRow:
     """One aligned source/target pair (one TU).
 
@@ -17,6 +30,9 @@ class AlignmentRow:
     output.  When text is modified, only the ``<seg>`` content is
     updated at write time; all TU attributes, ``<prop>``, ``<note>``,
     and inline TUV elements are kept intact.
+
+    Slotted: there is one instance per TU, so dropping the per-instance
+    ``__dict__`` keeps large files smaller and attribute reads faster.
     """
 
     source: str = ""
@@ -25,7 +41,8 @@ class AlignmentRow:
     # Original <tu> element for round-trip preservation (None for new rows)
     tu_element: etree._Element | None = field(default=None, repr=False)
 
-    # TUVs for languages beyond source/target (preserved verbatim)
+    # TUVs for languages beyond source/target (preserved verbatim; for
+    # parsed rows these are the children of tu_element)
     extra_tuvs: list[etree._Element] = field(default_factory=list, repr=False)
 
     # Track which columns were modified (for selective <seg> updates)
@@ -45,6 +62,8 @@ class AlignmentDocument:
     # Preserved full <header> element (includes <prop>/<note> children)
     header_element: etree._Element | None = field(default=None, repr=False)
     file_path: str | None = None
+    # Notified around insert_row()/remove_row(); set by the table model
+    row_listener: RowListener | None = field(default=None, repr=False, compare=False)
 
     # ── Row access helpers ──────────────────────────────────────
 
@@ -68,7 +87,19 @@ class AlignmentDocument:
     # ── Structural operations ───────────────────────────────────
 
     def insert_row(self, index: int, row: AlignmentRow) -> None:
+        listener = self.row_listener
+        if listener is None:
+            self.rows.insert(index, row)
+            return
+        listener.begin_insert_row(index)
         self.rows.insert(index, row)
+        listener.end_insert_row()
 
     def remove_row(self, index: int) -> AlignmentRow:
-        return self.rows.pop(index)
+        listener = self.row_listener
+        if listener is None:
+            return self.rows.pop(index)
+        listener.begin_remove_row(index)
+        removed = self.rows.pop(index)
+        listener.end_remove_row()
+        return removed
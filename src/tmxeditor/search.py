@@ -0,0 +1,127 @@
+"""Whole-document text index backing Find Next / Find Previous."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import re
+
+    from tmxeditor.models import AlignmentDocument
+
+# Record separator: joins cells so a query can never match across two cells.
+_SEP = "\x1e"
+
+
+class FindIndex:
+    """All cells of a document joined into one searchable string.
+
+    Cells are laid out row by row (source, then target), so a single
+    ``str.find`` / ``str.rfind`` replaces a Python loop over every cell.
+    Text-only edits are patched in with ``refresh_cells()``; after rows
+    are inserted or removed the index must be rebuilt.
+    """
+
+    def __init__(self, doc: AlignmentDocument) -> None:
+        self._doc = doc
+        cells = []
+        for row in doc.rows:
+            cells.append(row.source)
+            cells.append(row.target)
+        self._cells = cells
+        # Lowercased cells, built on the first case-insensitive search and
+        # then kept per cell so an edit only re-lowers what changed
+        self._folded_cells: list[str] | None = None
+        # Joined (text, offsets) pairs, re-joined lazily after edits
+        self._corpus: tuple[str, list[int]] | None = None
+        self._folded: tuple[str, list[int]] | None = None
+
+    @staticmethod
+    def _join(cells: list[str]) -> tuple[str, list[int]]:
+        """Join *cells* and return the text plus each cell's start offset."""
+        # lower() can change a cell's length, so offsets are per corpus
+        offsets = [0]
+        offsets.extend(accumulate(len(c) + 1 for c in cells[:-1]))
+        return _SEP.join(cells), offsets
+
+    def refresh_cells(self, cells: Iterable[tuple[int, int]]) -> bool:
+        """Re-read the given (row, col) cells after a text-only edit.
+
+        Returns False, leaving the index untouched, if the document's row
+        count no longer matches; the caller should then rebuild it.
+        """
+        if self._doc.row_count() * 2 != len(self._cells):
+            return False
+        for row, col in cells:
+            text = self._doc.get_cell(row, col)
+            self._cells[row * 2 + col] = text
+            if self._folded_cells is not None:
+                self._folded_cells[row * 2 + col] = text.lower()
+        self._corpus = self._folded = None
+        return True
+
+    def _haystack(self, case_sensitive: bool) -> tuple[str, list[int]]:
+        if case_sensitive:
+            if self._corpus is None:
+                self._corpus = self._join(self._cells)
+            return self._corpus
+        if self._folded is None:
+            if self._folded_cells is None:
+                self._folded_cells = [c.lower() for c in self._cells]
+            self._folded = self._join(self._folded_cells)
+        return self._folded
+
+    def find(
+        self,
+        query: str,
+        row: int,
+        col: int,
+        *,
+        forward: bool = True,
+        case_sensitive: bool = False,
+    ) -> tuple[int, int] | None:
+        """Return the (row, col) of the next cell containing *query*.
+
+        The search starts after (before, if not *forward*) the given cell
+        and wraps around, visiting the starting cell last.
+        """
+        cell_count = len(self._cells)
+        if not query or not cell_count or _SEP in query:
+            return None
+        text, offsets = self._haystack(case_sensitive)
+        if not case_sensitive:
+            query = query.lower()
+
+        cell = min(max(row * 2 + col, 0), cell_count - 1)
+        if forward:
+            start = offsets[cell + 1] if cell + 1 < cell_count else len(text)
+            idx = text.find(query, start)
+            if idx < 0:
+                idx = text.find(query)
+        else:
+            idx = text.rfind(query, 0, offsets[cell])
+            if idx < 0:
+                idx = text.rfind(query)
+        if idx < 0:
+            return None
+        hit = bisect_right(offsets, idx) - 1
+        return divmod(hit, 2)
+
+    def matching_cells(self, pattern: re.Pattern[str]) -> list[tuple[int, int]]:
+        """Return the (row, col) of every cell *pattern* matches, in order.
+
+        One regex scan over the joined text replaces a call per cell, so
+        only cells that actually match cost any Python work.
+        """
+        text, offsets = self._haystack(True)
+        hits: list[tuple[int, int]] = []
+        last = -1
+        for match in pattern.finditer(text):
+            cell = bisect_right(offsets, match.start()) - 1
+            if cell != last:
+                hits.append(divmod(cell, 2))
+                last = cell
+        return hits
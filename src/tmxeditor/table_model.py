@@ -6,10 +6,19 @@ visible rows — essential for performance with large TMX files.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+# data()/headerData() run for every visible cell on each repaint, and
+# comparing against PySide6 enum members is far slower than int equality
+_DISPLAY_ROLE = int(Qt.DisplayRole)  # 0
+_TOOLTIP_ROLE = int(Qt.ToolTipRole)  # 3
+# Short cells are fully visible in their wrapped row; only long ones get a tooltip
+_TOOLTIP_MIN_CHARS = 80
+_CELL_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
 
 class AlignmentTableModel(QAbstractTableModel):
     """Two-column model: Source (col 0) and Target (col 1)."""
@@ -21,6 +30,9 @@ class AlignmentTableModel(QAbstractTableModel):
         from tmxeditor.models import AlignmentDocument
 
         self._doc: AlignmentDocument | None = None
+        self._get_cell = None  # bound doc.get_cell, looked up once per document
+        # headerData runs on every header repaint: keep its strings around
+        self._h_headers: tuple[str, ...] = self.COLUMNS
 
     # ── Public API ──────────────────────────────────────────────
 
@@ -31,14 +43,67 @@ class AlignmentTableModel(QAbstractTableModel):
     def set_document(self, doc):
         """Replace the underlying document and refresh the view."""
         self.beginResetModel()
+        if self._doc is not None and self._doc.row_listener is self:
+            self._doc.row_listener = None
         self._doc = doc
+        self._get_cell = doc.get_cell if doc is not None else None
+        if doc is not None:
+            doc.row_listener = self
+            self._h_headers = (
+                f"{self.COLUMNS[0]} [{doc.source_lang}]",
+                f"{self.COLUMNS[1]} [{doc.target_lang}]",
+            )
+        else:
+            self._h_headers = self.COLUMNS
         self.endResetModel()
 
     def notify_data_changed(self) -> None:
-        """Signal full refresh after structural edits (split/merge/move)."""
+        """Signal a full refresh (settings changes, multi-step jumps)."""
         self.beginResetModel()
         self.endResetModel()
 
+    def notify_cells_changed(self, cells: Iterable[tuple[int, int]]) -> None:
+        """Signal a text-only change to the given (row, col) cells.
+
+        One dataChanged is emitted per run of consecutive rows, so the
+        view repaints and re-measures just those rows; cells far apart
+        (e.g. after Replace All) do not drag in everything between them.
+        """
+        cols_by_row: dict[int, int] = {}
+        for row, col in cells:
+            cols_by_row[row] = cols_by_row.get(row, 0) | (1 << col)
+        if not cols_by_row:
+            return
+        roles = [Qt.DisplayRole, Qt.ToolTipRole]
+        rows = sorted(cols_by_row)
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i < len(rows) and rows[i] == rows[i - 1] + 1:
+                continue
+            mask = 0  # bit 0: source column changed, bit 1: target column
+            for row in rows[start:i]:
+                mask |= cols_by_row[row]
+            self.dataChanged.emit(
+                self.index(rows[start], 0 if mask & 1 else 1),
+                self.index(rows[i - 1], 1 if mask & 2 else 0),
+                roles,
+            )
+            start = i
+
+    # ── Row listener (structural edits made through the document) ──
+
+    def begin_insert_row(self, index: int) -> None:
+        self.beginInsertRows(QModelIndex(), index, index)
+
+    def end_insert_row(self) -> None:
+        self.endInsertRows()
+
+    def begin_remove_row(self, index: int) -> None:
+        self.beginRemoveRows(QModelIndex(), index, index)
+
+    def end_remove_row(self) -> None:
+        self.endRemoveRows()
+
     # ── QAbstractTableModel overrides ───────────────────────────
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
@@ -52,26 +117,26 @@ class AlignmentTableModel(QAbstractTableModel):
         return 2
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
-        if not index.isValid() or self._doc is None:
+        get_cell = self._get_cell
+        if get_cell is None or not index.isValid():
             return None
-        if role in (Qt.DisplayRole, Qt.ToolTipRole):
-            return self._doc.get_cell(index.row(), index.column())
+        if role == _DISPLAY_ROLE:
+            return get_cell(index.row(), index.column())
+        if role == _TOOLTIP_ROLE:
+            text = get_cell(index.row(), index.column())
+            return text if len(text) > _TOOLTIP_MIN_CHARS else None
         return None
 
     def headerData(
         self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
     ) -> Any:
-        if role == Qt.DisplayRole:
+        if role == _DISPLAY_ROLE:
             if orientation == Qt.Horizontal and 0 <= section < 2:
-                label = self.COLUMNS[section]
-                if self._doc:
-                    lang = self._doc.source_lang if section == 0 else self._doc.target_lang
-                    return f"{label} [{lang}]"
-                return label
+                return self._h_headers[section]
             if orientation == Qt.Vertical:
                 return str(section + 1)
         return None
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
         # Editable flag enables the inline cursor delegate
-        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+        return _CELL_FLAGS
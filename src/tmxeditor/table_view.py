@@ -9,18 +9,65 @@ Provides:
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal, QSize, QRectF, QTimer
-from PySide6.QtGui import QTextOption, QTextDocument, QPen, QColor
+from PySide6.QtCore import Qt, Signal, QLine, QPoint, QRect, QSize, QRectF, QTimer, QSignalBlocker
+from PySide6.QtGui import (
+    QColor,
+    QKeySequence,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QStaticText,
+    QTextDocument,
+    QTextOption,
+)
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHeaderView,
     QPlainTextEdit,
     QStyle,
     QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTableView,
     QWidget,
 )
 
+from tmxeditor import config
+
+
+# QTextDocument's default margin, which sizeHint's measurement includes
+_TEXT_MARGIN = 4
+
+
+# Cell states that need the style's own drawing (highlight, focus frame)
+_STYLED_STATES = (
+    QStyle.StateFlag.State_Selected
+    | QStyle.StateFlag.State_HasFocus
+    | QStyle.StateFlag.State_MouseOver
+)
+
+_ALTERNATE = QStyleOptionViewItem.ViewItemFeature.Alternate
+
+
+# Standard shortcuts that change an editor's text (besides typed characters)
+_EDITING_KEYS = (
+    QKeySequence.Cut,
+    QKeySequence.Paste,
+    QKeySequence.Undo,
+    QKeySequence.Redo,
+    QKeySequence.DeleteStartOfWord,
+    QKeySequence.DeleteEndOfWord,
+    QKeySequence.DeleteEndOfLine,
+    QKeySequence.DeleteCompleteLine,
+)
+
+
+def _cache_put(cache: dict, key, value, limit: int) -> None:
+    """Insert into a bounded cache, dropping the oldest entry when full."""
+    if len(cache) >= limit:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
 
 class _CellEditor(QPlainTextEdit):
     """In-cell editor that supports two modes:
@@ -54,7 +101,8 @@ class _CellEditor(QPlainTextEdit):
         self.setCursorWidth(2)
         self.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
         self.setStyleSheet("QPlainTextEdit { padding: 4px; }")
-        # Revert any text changes that happen in cursor-only mode
+        # Fallback for changes that bypass keyPressEvent (context-menu
+        # paste, drag and drop, input methods): revert them in cursor mode
         self.textChanged.connect(self._on_text_changed)
 
     def set_guard_text(self, text: str) -> None:
@@ -72,16 +120,31 @@ class _CellEditor(QPlainTextEdit):
             # Snapshot current text as guard
             self._guard_text = self.toPlainText()
 
+    @staticmethod
+    def _modifies_text(event) -> bool:
+        """Whether a key press would insert or delete text."""
+        if event.key() in (
+            Qt.Key_Backspace, Qt.Key_Delete, Qt.Key_Return, Qt.Key_Enter, Qt.Key_Tab
+        ):
+            return True
+        if any(event.matches(seq) for seq in _EDITING_KEYS):
+            return True
+        # Ctrl/Cmd+letter is a shortcut (select all, copy); AltGr = Ctrl+Alt types
+        mods = event.modifiers()
+        if mods & (Qt.ControlModifier | Qt.MetaModifier) and not mods & Qt.AltModifier:
+            return False
+        text = event.text()
+        return bool(text) and text.isprintable()
+
     def _on_text_changed(self) -> None:
         """In cursor-only mode, revert any text modifications."""
         if not self._editable and self.toPlainText() != self._guard_text:
             pos = self.textCursor().position()
-            self.blockSignals(True)
-            self.setPlainText(self._guard_text)
-            cursor = self.textCursor()
-            cursor.setPosition(min(pos, len(self._guard_text)))
-            self.setTextCursor(cursor)
-            self.blockSignals(False)
+            with QSignalBlocker(self):
+                self.setPlainText(self._guard_text)
+                cursor = self.textCursor()
+                cursor.setPosition(min(pos, len(self._guard_text)))
+                self.setTextCursor(cursor)
 
     def keyPressEvent(self, event) -> None:
         key = event.key()
@@ -113,8 +176,13 @@ class _CellEditor(QPlainTextEdit):
             event.accept()
             return
 
-        # Always pass to super — navigation keys work naturally,
-        # and any text changes in cursor-only mode are reverted by _on_text_changed
+        # Cursor-only mode: drop editing keys here, rather than letting the
+        # edit through and re-setting the whole text in _on_text_changed
+        if not self._editable and self._modifies_text(event):
+            event.accept()
+            return
+
+        # Navigation keys work naturally
         super().keyPressEvent(event)
 
 
@@ -125,6 +193,8 @@ class _InlineCursorDelegate(QStyledItemDelegate):
     """
 
     _MIN_ROW_HEIGHT = 40
+    _SIZE_CACHE_LIMIT = 4096  # measured cells kept; oldest dropped first
+    _TEXT_CACHE_LIMIT = 2048  # laid-out cell texts kept for painting
 
     split_requested = Signal(int, int, int)  # row, col, cursor_pos
     edit_confirmed = Signal(int, int, str, str)  # row, col, old_text, new_text
@@ -134,10 +204,35 @@ class _InlineCursorDelegate(QStyledItemDelegate):
         self._current_editor: _CellEditor | None = None
         self._current_index = None
         self._original_text = ""
+        # (text, width, font size, wrap mode) -> QSize: laying out a
+        # QTextDocument is the expensive part of every row measurement
+        self._size_cache: dict[tuple, QSize] = {}
+        # Same key -> QStaticText: glyph layout is reused across repaints
+        self._text_cache: dict[tuple, QStaticText] = {}
+        # One document for all sizeHint misses, re-set only when needed
+        self._measure_doc = QTextDocument()
+        self._measure_doc.setUndoRedoEnabled(False)
+        self._measure_style: tuple | None = None  # (font size, wrap mode)
+        self.reload_settings()
+
+    def reload_settings(self) -> None:
+        """Re-read per-column font sizes and word wrap from config."""
+        self._font_sizes = (config.get_font_size("source"), config.get_font_size("target"))
+        # 'word_wrap' True (default): WrapAtWordBoundaryOrAnywhere
+        #   — wraps at spaces for English, falls back to character breaks
+        #     for Thai/CJK (no spaces).
+        # False: WordWrap — wraps only at spaces/word boundaries; Thai text
+        #   without spaces will extend beyond the cell width.
+        if config.get_display("word_wrap", True):
+            self._wrap = QTextOption.WrapAtWordBoundaryOrAnywhere
+        else:
+            self._wrap = QTextOption.WordWrap
+        # Shared by the measuring document and every QStaticText layout
+        self._text_option = QTextOption()
+        self._text_option.setWrapMode(self._wrap)
 
     def _font_size_for_col(self, col: int) -> int:
-        from tmxeditor import config
-        return config.get_font_size("source" if col == 0 else "target")
+        return self._font_sizes[col]
 
     def createEditor(self, parent, option, index):
         editor = _CellEditor(parent)
@@ -150,18 +245,10 @@ class _InlineCursorDelegate(QStyledItemDelegate):
         font.setPointSize(self._font_size_for_col(index.column()))
         editor.setFont(font)
 
-        row = index.row()
-        col = index.column()
-
-        editor.split_at_cursor.connect(
-            lambda pos: self.split_requested.emit(row, col, pos)
-        )
-        editor.edit_confirmed.connect(
-            lambda new_text: self._on_edit_confirmed(row, col, new_text)
-        )
-        editor.edit_cancelled.connect(
-            lambda: self._on_edit_cancelled(editor)
-        )
+        # Bound slots read the cell from _current_index: no closures per editor
+        editor.split_at_cursor.connect(self._on_split_at_cursor)
+        editor.edit_confirmed.connect(self._on_edit_confirmed)
+        editor.edit_cancelled.connect(self._on_edit_cancelled)
         return editor
 
     def setEditorData(self, editor, index):
@@ -191,19 +278,8 @@ class _InlineCursorDelegate(QStyledItemDelegate):
         option.font = font
 
     def _wrap_mode(self):
-        """Return the active QTextOption wrap mode based on config.
-
-        When 'word_wrap' is True (default): WrapAtWordBoundaryOrAnywhere
-          — wraps at spaces for English, falls back to character breaks
-            for Thai/CJK (no spaces).
-        When False: WrapAtWordBoundary
-          — wraps only at spaces/word boundaries. Thai text without
-            spaces will extend beyond the cell width.
-        """
-        from tmxeditor import config
-        if config.get_display("word_wrap", True):
-            return QTextOption.WrapAtWordBoundaryOrAnywhere
-        return QTextOption.WordWrap
+        """Return the active QTextOption wrap mode (see reload_settings)."""
+        return self._wrap
 
     def sizeHint(self, option, index):
         """Calculate cell height using QTextDocument for proper text wrapping."""
@@ -211,74 +287,131 @@ class _InlineCursorDelegate(QStyledItemDelegate):
         if not text:
             return QSize(option.rect.width(), self._MIN_ROW_HEIGHT)
 
-        font = option.font
-        font.setPointSize(self._font_size_for_col(index.column()))
-
-        doc = QTextDocument()
-        doc.setDefaultFont(font)
-        text_option = QTextOption()
-        text_option.setWrapMode(self._wrap_mode())
-        doc.setDefaultTextOption(text_option)
-        doc.setPlainText(text)
-
         # Use available column width (minus padding)
         width = option.rect.width() if option.rect.width() > 0 else 300
+        font_size = self._font_size_for_col(index.column())
+        wrap_mode = self._wrap_mode()
+        # Font size and wrap mode are part of the key, so settings changes
+        # need no explicit invalidation
+        key = (text, width, font_size, wrap_mode)
+        cache = self._size_cache
+        size = cache.get(key)
+        if size is not None:
+            return size
+
+        doc = self._measure_doc
+        if self._measure_style != (font_size, wrap_mode):
+            font = option.font
+            font.setPointSize(font_size)
+            doc.setDefaultFont(font)
+            doc.setDefaultTextOption(self._text_option)
+            self._measure_style = (font_size, wrap_mode)
+        doc.setPlainText(text)
         doc.setTextWidth(max(width - 16, 50))  # 16px for padding (8px each side)
 
         height = int(doc.size().height()) + 12  # 12px for top/bottom padding
-        return QSize(width, max(height, self._MIN_ROW_HEIGHT))
+        size = QSize(width, max(height, self._MIN_ROW_HEIGHT))
+        _cache_put(cache, key, size, self._SIZE_CACHE_LIMIT)
+        return size
+
+    def _static_text(self, text: str, width: int, painter, font) -> QStaticText:
+        """Return *text* laid out for a cell *width* px wide (cached)."""
+        wrap_mode = self._wrap_mode()
+        key = (text, width, font.pointSize(), wrap_mode)
+        static = self._text_cache.get(key)
+        if static is None:
+            # In plain-text QStaticText only U+2028 breaks a line
+            static = QStaticText(text.replace("\n", "\u2028"))
+            static.setTextFormat(Qt.PlainText)
+            static.setTextOption(self._text_option)
+            # Same line width as the QTextDocument that sizeHint measures
+            static.setTextWidth(max(width - 16, 50) - 2 * _TEXT_MARGIN)
+            static.prepare(painter.transform(), font)
+            _cache_put(self._text_cache, key, static, self._TEXT_CACHE_LIMIT)
+        return static
 
     def paint(self, painter, option, index):
-        """Paint cell text with proper word wrapping for Thai/CJK."""
-        # Let the default style draw selection/focus/background
-        self.initStyleOption(option, index)
-        style = option.widget.style() if option.widget else None
-        if style:
-            # Draw background and focus rect, but NOT the text
-            option.text = ""
-            style.drawControl(style.ControlElement.CE_ItemViewItem, option, painter, option.widget)
-
-        # Draw subtle horizontal separator at bottom of cell
-        painter.save()
-        painter.setPen(QPen(QColor(220, 220, 220), 1))
-        y = option.rect.bottom()
-        painter.drawLine(option.rect.left(), y, option.rect.right(), y)
-        painter.restore()
+        """Paint cell text with proper word wrapping for Thai/CJK.
 
+        Finished cells are kept in QPixmapCache, so repainting or
+        scrolling back over them is a blit instead of a style pass.
+        """
+        self.initStyleOption(option, index)
         text = index.data(Qt.DisplayRole) or ""
+        rect = option.rect
+        ratio = painter.device().devicePixelRatio()
+        # Everything the rendering depends on; the row itself only matters
+        # through the alternate-background feature flag
+        key = (
+            f"tmxcell:{rect.width()}x{rect.height()}@{ratio}:{option.state.value}"
+            f":{option.features.value}:{option.palette.cacheKey()}:{option.font.pointSize()}"
+            f":{self._wrap_mode().value}:{len(text)}:{hash(text)}"
+        )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(rect.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            cell_option = QStyleOptionViewItem(option)
+            cell_option.rect = QRect(QPoint(0, 0), rect.size())
+            cell_painter = QPainter(pixmap)
+            self._paint_cell(cell_painter, cell_option, text)
+            cell_painter.end()
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def _paint_cell(self, painter, option, text: str) -> None:
+        if option.state & _STYLED_STATES:
+            # Let the default style draw selection/focus/background
+            style = option.widget.style() if option.widget else None
+            if style:
+                # Draw background and focus rect, but NOT the text
+                option.text = ""
+                style.drawControl(style.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+        elif option.features & _ALTERNATE:
+            # Plain cell: row shading is all the style would draw
+            painter.fillRect(option.rect, option.palette.alternateBase())
+
         if not text:
             return
 
-        doc = QTextDocument()
-        doc.setDefaultFont(option.font)
-        text_option = QTextOption()
-        text_option.setWrapMode(self._wrap_mode())
-        doc.setDefaultTextOption(text_option)
-        doc.setPlainText(text)
-        doc.setTextWidth(max(option.rect.width() - 16, 50))
+        static = self._static_text(text, option.rect.width(), painter, option.font)
 
         # Use white text when selected so it's readable on the highlight
+        palette = option.palette
         if option.state & QStyle.StateFlag.State_Selected:
-            palette = option.palette
             color = palette.color(palette.ColorGroup.Active, palette.ColorRole.HighlightedText)
-            doc.setDefaultStyleSheet(f"body {{ color: {color.name()}; }}")
-            doc.setHtml(f"<body>{doc.toPlainText()}</body>")
+        else:
+            color = palette.color(palette.ColorGroup.Active, palette.ColorRole.Text)
 
         painter.save()
-        painter.translate(option.rect.left() + 8, option.rect.top() + 6)
-        doc.drawContents(painter)
+        painter.setFont(option.font)
+        painter.setPen(color)
+        painter.drawStaticText(
+            option.rect.left() + 8 + _TEXT_MARGIN,
+            option.rect.top() + 6 + _TEXT_MARGIN,
+            static,
+        )
         painter.restore()
 
-    def _on_edit_confirmed(self, row, col, new_text):
+    def _on_split_at_cursor(self, pos: int) -> None:
+        index = self._current_index
+        self.split_requested.emit(index.row(), index.column(), pos)
+
+    def _on_edit_confirmed(self, new_text: str) -> None:
         if new_text != self._original_text:
-            self.edit_confirmed.emit(row, col, self._original_text, new_text)
+            index = self._current_index
+            self.edit_confirmed.emit(
+                index.row(), index.column(), self._original_text, new_text
+            )
         if self._current_editor:
             self._current_editor.set_editable(False)
             # Close the editor
             self.commitData.emit(self._current_editor)
             self.closeEditor.emit(self._current_editor)
 
-    def _on_edit_cancelled(self, editor):
+    def _on_edit_cancelled(self) -> None:
+        editor = self._current_editor
         editor.setPlainText(self._original_text)
         editor.set_editable(False)
         self.closeEditor.emit(editor)
@@ -292,6 +425,9 @@ class AlignmentTableView(QTableView):
     # Emitted when user confirms an inline edit
     inline_edit_confirmed = Signal(int, int, str, str)  # row, col, old, new
 
+    # Subtle horizontal line under each row (the built-in grid is off)
+    _SEPARATOR_PEN = QPen(QColor(220, 220, 220), 1)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -308,7 +444,9 @@ class AlignmentTableView(QTableView):
             | QAbstractItemView.DoubleClicked
         )
 
-        # Custom inline delegate
+        # Custom inline delegate; its painted cells live in QPixmapCache,
+        # whose 10 MB default holds only a screen or two of them
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 64 * 1024))  # KB
         self._delegate = _InlineCursorDelegate(self)
         self._delegate.split_requested.connect(self.split_at_position.emit)
         self._delegate.edit_confirmed.connect(self.inline_edit_confirmed.emit)
@@ -319,50 +457,80 @@ class AlignmentTableView(QTableView):
         header.setStretchLastSection(True)
         header.setSectionResizeMode(0, QHeaderView.Interactive)
 
-        # Apply word wrap from config
-        self._apply_word_wrap()
-
-        # Vertical header (row numbers)
+        # Vertical header (row numbers).  Heights are fixed and measured
+        # only for rows on screen: ResizeToContents would measure every
+        # row of the document on each relayout.
         vheader = self.verticalHeader()
         vheader.setDefaultSectionSize(44)
-        vheader.setSectionResizeMode(QHeaderView.ResizeToContents)
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+
+        # One single-shot timer coalesces every pending reflow
+        self._reflow_timer = QTimer(self)
+        self._reflow_timer.setSingleShot(True)
+        self._reflow_timer.timeout.connect(self._reflow_rows)
+
+        # Apply word wrap from config
+        self.apply_display_settings()
 
         # Reflow row heights when column is resized
         header.sectionResized.connect(self._on_column_resized)
+        # Measure rows as they scroll into view
+        self.verticalScrollBar().valueChanged.connect(self._reflow_rows)
 
-        # Disable built-in grid (we draw horizontal lines in the delegate)
+        # Disable built-in grid (paintEvent draws horizontal lines instead)
         self.setShowGrid(False)
 
     # ── Word wrap & column sizing helpers ───────────────────────
 
-    def _apply_word_wrap(self) -> None:
-        """Apply the word wrap setting from config."""
-        from tmxeditor import config
-        wrap = config.get_display("word_wrap", True)
-        self.setWordWrap(wrap)
+    def apply_display_settings(self) -> None:
+        """Apply the word wrap and column font size settings from config."""
+        self._delegate.reload_settings()
+        self.setWordWrap(config.get_display("word_wrap", True))
         # Reflow row heights immediately (user toggled setting)
         self._reflow_rows()
 
-    def _reflow_rows(self) -> None:
-        """Force recalculation of all visible row heights."""
-        vheader = self.verticalHeader()
-        vheader.setSectionResizeMode(QHeaderView.ResizeToContents)
-
-    def _freeze_row_heights(self) -> None:
-        """Lock row heights to current values during resize for performance."""
+    def _reflow_rows(self, *_args) -> None:
+        """Re-measure the heights of the rows in the viewport."""
+        model = self.model()
+        first = self.rowAt(0)
+        if model is None or first < 0:
+            return
         vheader = self.verticalHeader()
-        if vheader.sectionResizeMode(0) != QHeaderView.Fixed:
-            vheader.setSectionResizeMode(QHeaderView.Fixed)
-
-    def _schedule_reflow(self) -> None:
-        """Debounced reflow — freezes rows during resize, recalculates when stable."""
-        self._freeze_row_heights()
-        if not hasattr(self, "_reflow_timer"):
-            self._reflow_timer = QTimer(self)
-            self._reflow_timer.setSingleShot(True)
-            self._reflow_timer.setInterval(150)
-            self._reflow_timer.timeout.connect(self._reflow_rows)
-        self._reflow_timer.start()
+        bottom = self.viewport().height()
+        rows = model.rowCount()
+        # Walk down from the top row: re-measuring can change how many fit
+        row = first
+        y = vheader.sectionViewportPosition(first)
+        changed = False
+        while row < rows and y < bottom:
+            old = vheader.sectionSize(row)
+            self.resizeRowToContents(row)
+            new = vheader.sectionSize(row)
+            changed |= new != old
+            y += new
+            row += 1
+        if changed:
+            # Scroll range depends on the heights of the last rows
+            self.updateGeometries()
+
+    def _schedule_reflow(self, delay: int = 150) -> None:
+        """Debounced reflow — rows keep their heights until resizing settles."""
+        self._reflow_timer.start(delay)
+
+    def setModel(self, model) -> None:
+        """Set the model and reflow whenever its rows change."""
+        super().setModel(model)
+        if model is not None:
+            for signal in (
+                model.modelReset,
+                model.layoutChanged,
+                model.rowsInserted,
+                model.rowsRemoved,
+            ):
+                signal.connect(self._schedule_reflow_now)
+
+    def _schedule_reflow_now(self, *_args) -> None:
+        self._schedule_reflow(0)
 
     def _on_column_resized(self, _logical_index: int, _old_size: int, _new_size: int) -> None:
         """Reflow row heights when user drags the column divider."""
@@ -371,7 +539,6 @@ class AlignmentTableView(QTableView):
     def resizeEvent(self, event) -> None:
         """On window resize, apply column ratio and schedule deferred reflow."""
         super().resizeEvent(event)
-        from tmxeditor import config
         header = self.horizontalHeader()
         total = self.viewport().width()
         if total > 0 and self.model() and self.model().columnCount() >= 2:
@@ -380,8 +547,51 @@ class AlignmentTableView(QTableView):
             header.resizeSection(0, col0_width)
         self._schedule_reflow()
 
+    def paintEvent(self, event) -> None:
+        """Paint the cells, then every row separator in one batch."""
+        super().paintEvent(event)
+        model = self.model()
+        if model is None or not model.rowCount():
+            return
+        rect = event.rect()
+        first = max(self.rowAt(rect.top()), 0)
+        last = self.rowAt(rect.bottom())
+        if last < 0:
+            last = model.rowCount() - 1
+        last_col = model.columnCount() - 1
+        right = self.columnViewportPosition(last_col) + self.columnWidth(last_col) - 1
+        lines = []
+        for row in range(first, last + 1):
+            y = self.rowViewportPosition(row) + self.rowHeight(row) - 1
+            lines.append(QLine(0, y, right, y))
+        painter = QPainter(self.viewport())
+        painter.setPen(self._SEPARATOR_PEN)
+        painter.drawLines(lines)
+        painter.end()
+
+    def dataChanged(self, top_left, bottom_right, roles=()) -> None:
+        """Repaint the changed cells and re-measure only their rows."""
+        super().dataChanged(top_left, bottom_right, roles)
+        first, last = top_left.row(), bottom_right.row()
+        if last - first > self._max_visible_rows():
+            # Replace All etc.: rows off screen are measured on scrolling in
+            self._reflow_rows()
+            return
+        for row in range(first, last + 1):
+            self.resizeRowToContents(row)
+
+    def _max_visible_rows(self) -> int:
+        """Upper bound on how many rows fit in the viewport."""
+        min_height = max(self.verticalHeader().minimumSectionSize(), 1)
+        return self.viewport().height() // min_height + 1
+
     # ── Navigation helpers ──────────────────────────────────────
 
+    def scrollTo(self, index, hint=QAbstractItemView.EnsureVisible) -> None:
+        super().scrollTo(index, hint)
+        # Rows measured on the way in may have pushed *index* out of view
+        super().scrollTo(index, hint)
+
     def current_row(self) -> int:
         idx = self.currentIndex()
         return idx.row() if idx.isValid() else -1
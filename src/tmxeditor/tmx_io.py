@@ -8,16 +8,22 @@ preserved from the original file.  Only modified segment text is updated.
 from __future__ import annotations
 
 import copy
+import functools
 import os
+import re
 import shutil
 import tempfile
 from collections import Counter
 from pathlib import Path
+from typing import BinaryIO
 
 from lxml import etree
 
 from tmxeditor.models import AlignmentDocument, AlignmentRow
 
+# Clark-notation name of the xml:lang attribute
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
 # ── Parsing ─────────────────────────────────────────────────────
 
 
@@ -28,41 +34,42 @@ def _seg_text(tuv_elem: etree._Element) -> str:
     For mixed content, we concatenate all text nodes (text + tail of children)
     to get the "raw" segment text the user sees.
     """
-    seg = tuv_elem.find("seg")
+    # iterchildren() walks the children directly; find() goes through
+    # ElementPath on every call
+    seg = next(tuv_elem.iterchildren("seg"), None)
     if seg is None:
         return ""
+    if not len(seg):
+        # Plain segment, the common case: skip the itertext() generator
+        return seg.text or ""
     # itertext() yields all text content including children's tail text
     return "".join(seg.itertext())
 
 
+@functools.lru_cache(maxsize=64)
 def _normalize_lang(lang: str) -> str:
-    """Normalize a language code for comparison (case-insensitive)."""
+    """Normalize a language code for comparison (case-insensitive).
+
+    Memoized: a file has only a handful of distinct codes, and returning
+    the same string object makes the per-TUV comparisons identity checks.
+    """
     return lang.strip().lower()
 
 
 def _detect_languages(
-    tree: etree._ElementTree,
+    header: etree._Element | None,
+    lang_counter: Counter[str],
 ) -> tuple[str, str]:
     """Determine source and target language codes.
 
     Strategy:
       1. If <header srclang="..."> is present, use it as source language.
-      2. Collect all xml:lang values from <tuv> elements.
+      2. *lang_counter* holds the (normalized) xml:lang of every <tuv>.
       3. Source = srclang from header (or most common lang).
       4. Target = second most common lang.
 
     All language codes are normalized to lowercase for consistent matching.
     """
-    root = tree.getroot()
-    header = root.find("header")
-
-    # Gather language frequency from TUVs (normalized)
-    lang_counter: Counter[str] = Counter()
-    for tuv in root.iter("tuv"):
-        lang = tuv.get("{http://www.w3.org/XML/1998/namespace}lang") or tuv.get("lang", "")
-        if lang:
-            lang_counter[_normalize_lang(lang)] += 1
-
     if len(lang_counter) < 2:
         langs = list(lang_counter.keys())
         if len(langs) == 0:
@@ -103,57 +110,84 @@ def parse_tmx(path: str | Path) -> AlignmentDocument:
       - All TUV elements including non-source/target languages
       - Inline <seg> content (bpt, ept, ph, it, hi, etc.)
 
+    The file is read in one streaming pass: each <tu> is detached from
+    <body> as soon as it is complete, so the parsed tree never holds more
+    than one TU and the detached element itself is kept for round-trip.
+
     Raises:
         etree.XMLSyntaxError: On malformed XML.
         ValueError: On structural problems.
     """
     path = Path(path)
-    tree = etree.parse(str(path))  # noqa: S320 — trusted local file
-    root = tree.getroot()
+    header: etree._Element | None = None
+    # (tu, [(normalized lang, tuv), ...]) — sorted into rows once the
+    # source and target languages are known
+    units: list[tuple[etree._Element, list[tuple[str, etree._Element]]]] = []
+    lang_counter: Counter[str] = Counter()
+
+    # huge_tree lifts libxml2's size limits (e.g. 10 MB per text node) that
+    # large TMX files can hit.  Blank text is *not* removed: whitespace
+    # between inline tags is part of the segment.
+    context = etree.iterparse(  # noqa: S320 — trusted local file
+        str(path), events=("end",), tag=("header", "tu"), huge_tree=True
+    )
+    for _event, elem in context:
+        parent = elem.getparent()
+        if elem.tag == "header":
+            if header is None and parent is not None and parent.getparent() is None:
+                header = elem
+            continue
+        if parent is None or parent.tag != "body":
+            continue
+        tuvs = []
+        for tuv in elem.iterchildren("tuv"):
+            lang = tuv.get(_XML_LANG) or tuv.get("lang", "")
+            normalized = _normalize_lang(lang)
+            if normalized:
+                lang_counter[normalized] += 1
+            tuvs.append((normalized, tuv))
+        # Detach the finished TU: it becomes the row's own element and
+        # <body> stays empty while the rest of the file is read
+        parent.remove(elem)
+        units.append((elem, tuvs))
+    root = context.root
 
     # Strip namespace if present (some TMX files use a default namespace)
     tag = etree.QName(root.tag).localname if "}" in root.tag else root.tag
     if tag.lower() != "tmx":
         raise ValueError(f"Root element is <{root.tag}>, expected <tmx>")
+    if root.find("body") is None:
+        raise ValueError("TMX file has no <body> element")
 
-    source_lang, target_lang = _detect_languages(tree)
+    source_lang, target_lang = _detect_languages(header, lang_counter)
 
     # Capture full header element for round-trip
-    header = root.find("header")
     header_attribs: dict[str, str] = {}
     header_element: etree._Element | None = None
     if header is not None:
         header_attribs = dict(header.attrib)
         header_element = copy.deepcopy(header)
 
-    # Parse TUs
-    body = root.find("body")
-    if body is None:
-        raise ValueError("TMX file has no <body> element")
-
     rows: list[AlignmentRow] = []
-    for tu in body.findall("tu"):
+    for tu, tuvs in units:
         source_text = ""
         target_text = ""
         extra_tuvs: list[etree._Element] = []
 
-        for tuv in tu.findall("tuv"):
-            lang = tuv.get("{http://www.w3.org/XML/1998/namespace}lang") or tuv.get("lang", "")
-            normalized = _normalize_lang(lang)
-            text = _seg_text(tuv)
-
+        for normalized, tuv in tuvs:
             if normalized == source_lang:
-                source_text = text
+                source_text = _seg_text(tuv)
             elif normalized == target_lang:
-                target_text = text
+                target_text = _seg_text(tuv)
             else:
-                # Preserve TUVs for other languages
-                extra_tuvs.append(copy.deepcopy(tuv))
+                # Other languages: the TUV stays in tu_element, which is
+                # never mutated, so the row can share it rather than copy it
+                extra_tuvs.append(tuv)
 
         rows.append(AlignmentRow(
             source=source_text,
             target=target_text,
-            tu_element=copy.deepcopy(tu),
+            tu_element=tu,
             extra_tuvs=extra_tuvs,
         ))
 
@@ -176,7 +210,7 @@ def _update_seg_text(tuv: etree._Element, new_text: str) -> None:
     Removes any inline children (bpt, ept, ph, etc.) and sets
     plain text content.
     """
-    seg = tuv.find("seg")
+    seg = next(tuv.iterchildren("seg"), None)
     if seg is None:
         seg = etree.SubElement(tuv, "seg")
     # Clear all children and text
@@ -188,9 +222,10 @@ def _update_seg_text(tuv: etree._Element, new_text: str) -> None:
 
 def _find_tuv(tu: etree._Element, lang: str) -> etree._Element | None:
     """Find a <tuv> element matching the given language (case-insensitive)."""
-    for tuv in tu.findall("tuv"):
-        tuv_lang = tuv.get("{http://www.w3.org/XML/1998/namespace}lang") or tuv.get("lang", "")
-        if _normalize_lang(tuv_lang) == _normalize_lang(lang):
+    lang = _normalize_lang(lang)
+    for tuv in tu.iterchildren("tuv"):
+        tuv_lang = tuv.get(_XML_LANG) or tuv.get("lang", "")
+        if _normalize_lang(tuv_lang) == lang:
             return tuv
     return None
 
@@ -212,7 +247,7 @@ def _build_tu_from_row(row: AlignmentRow, source_lang: str, target_lang: str) ->
             else:
                 # Source TUV was missing — create it
                 src_tuv = etree.SubElement(tu, "tuv")
-                src_tuv.set("{http://www.w3.org/XML/1998/namespace}lang", source_lang)
+                src_tuv.set(_XML_LANG, source_lang)
                 _update_seg_text(src_tuv, row.source)
 
         # Update target segment if modified
@@ -222,7 +257,7 @@ def _build_tu_from_row(row: AlignmentRow, source_lang: str, target_lang: str) ->
                 _update_seg_text(tgt_tuv, row.target)
             else:
                 tgt_tuv = etree.SubElement(tu, "tuv")
-                tgt_tuv.set("{http://www.w3.org/XML/1998/namespace}lang", target_lang)
+                tgt_tuv.set(_XML_LANG, target_lang)
                 _update_seg_text(tgt_tuv, row.target)
 
         return tu
@@ -231,12 +266,12 @@ def _build_tu_from_row(row: AlignmentRow, source_lang: str, target_lang: str) ->
     tu = etree.Element("tu")
 
     tuv_src = etree.SubElement(tu, "tuv")
-    tuv_src.set("{http://www.w3.org/XML/1998/namespace}lang", source_lang)
+    tuv_src.set(_XML_LANG, source_lang)
     seg_src = etree.SubElement(tuv_src, "seg")
     seg_src.text = row.source
 
     tuv_tgt = etree.SubElement(tu, "tuv")
-    tuv_tgt.set("{http://www.w3.org/XML/1998/namespace}lang", target_lang)
+    tuv_tgt.set(_XML_LANG, target_lang)
     seg_tgt = etree.SubElement(tuv_tgt, "seg")
     seg_tgt.text = row.target
 
@@ -247,6 +282,40 @@ def _build_tu_from_row(row: AlignmentRow, source_lang: str, target_lang: str) ->
     return tu
 
 
+# One-pass escaping for text content: the markup characters, plus CR
+# (as lxml writes it, so it survives parsing)
+_XML_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\r": "&#13;"})
+_XML_ATTR_ESCAPES = str.maketrans({'"': "&quot;"})
+
+# Characters XML 1.0 cannot represent, which lxml refuses on assignment
+_XML_INVALID_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def _escape_text(text: str) -> str:
+    """Escape *text* for element content, rejecting it as lxml would."""
+    if _XML_INVALID_CHARS.search(text):
+        raise ValueError(
+            "All strings must be XML compatible: Unicode or ASCII, "
+            "no NULL bytes or control characters"
+        )
+    return text.translate(_XML_TEXT_ESCAPES)
+
+
+def _new_tu_parts(source_lang: str, target_lang: str) -> tuple[str, str, str]:
+    """Return the markup around the source and target text of a new TU."""
+    def lang(code: str) -> str:
+        return _escape_text(code).translate(_XML_ATTR_ESCAPES)
+
+    return (
+        f'<tu>\n      <tuv xml:lang="{lang(source_lang)}">\n        <seg>',
+        f'</seg>\n      </tuv>\n      <tuv xml:lang="{lang(target_lang)}">\n        <seg>',
+        "</seg>\n      </tuv>\n    </tu>",
+    )
+
+
+_XML_PROLOG = b"<?xml version='1.0' encoding='UTF-8'?>\n<tmx version=\"1.4\">\n  "
+
+
 def write_tmx(
     doc: AlignmentDocument,
     path: str | Path,
@@ -256,8 +325,9 @@ def write_tmx(
     """Write an AlignmentDocument to a TMX file atomically.
 
     Round-trip preservation:
-      - If a row has an original <tu> element, it is cloned and only
-        modified <seg> content is updated.
+      - Unmodified rows are serialized straight from their original <tu>
+        element; for modified rows it is cloned and only the changed
+        <seg> content is updated.
       - TU attributes, <prop>, <note>, and unchanged inline tags
         are preserved from the original element.
 
@@ -271,15 +341,53 @@ def write_tmx(
     target_dir = path.parent
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build XML tree
-    root = etree.Element("tmx", version="1.4")
+    # Atomic write: temp file → os.replace()
+    fd, tmp_path = tempfile.mkstemp(
+        dir=str(target_dir), suffix=".tmx.tmp"
+    )
+    try:
+        # Stream into the temp file rather than joining the whole
+        # document into one bytes object first
+        with os.fdopen(fd, "wb") as out:
+            _write_document(doc, out)
 
+        # Backup existing file
+        if backup and path.exists():
+            _backup(path, path.with_suffix(path.suffix + ".bak"))
+
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _backup(path: Path, bak_path: Path) -> None:
+    """Keep the current *path* as *bak_path* before it is replaced.
+
+    A hard link costs nothing however large the file is.  It stays a true
+    snapshot because the new version is swapped in with os.replace(), never
+    written in place.  Filesystems without hard links get a copy.
+    """
+    try:
+        os.unlink(bak_path)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(path, bak_path)
+    except OSError:
+        shutil.copy2(str(path), str(bak_path))
+
+
+def _write_document(doc: AlignmentDocument, out: BinaryIO) -> None:
+    """Serialize *doc* as TMX into the binary file *out*."""
     # Rebuild header: use preserved element if available, else build from attribs
     if doc.header_element is not None:
         header = copy.deepcopy(doc.header_element)
         # Update srclang to match current document
         header.set("srclang", doc.source_lang)
-        root.append(header)
     else:
         h_attribs = dict(doc.header_attribs)
         h_attribs.setdefault("creationtool", "TMXEditor")
@@ -290,39 +398,26 @@ def write_tmx(
         h_attribs.setdefault("srclang", doc.source_lang)
         h_attribs.setdefault("datatype", "plaintext")
         h_attribs["srclang"] = doc.source_lang
-        etree.SubElement(root, "header", **h_attribs)
-
-    body = etree.SubElement(root, "body")
+        header = etree.Element("header", **h_attribs)
+
+    # Serialize TU by TU: unmodified TUs are written straight from the
+    # parsed element, without cloning it into a new tree.
+    write = out.write
+    write(_XML_PROLOG)
+    write(etree.tostring(header, encoding="UTF-8", with_tail=False))
+    write(b"\n  <body>")
+    tu_open, tu_middle, tu_close = _new_tu_parts(doc.source_lang, doc.target_lang)
     for row in doc.rows:
-        tu = _build_tu_from_row(row, doc.source_lang, doc.target_lang)
-        body.append(tu)
-
-    # Serialize
-    xml_bytes = etree.tostring(
-        root,
-        xml_declaration=True,
-        encoding="UTF-8",
-        pretty_print=True,
-    )
-
-    # Atomic write: temp file → os.replace()
-    fd, tmp_path = tempfile.mkstemp(
-        dir=str(target_dir), suffix=".tmx.tmp"
-    )
-    try:
-        os.write(fd, xml_bytes)
-        os.close(fd)
-        fd = -1  # mark as closed
-
-        # Backup existing file
-        if backup and path.exists():
-            bak_path = path.with_suffix(path.suffix + ".bak")
-            shutil.copy2(str(path), str(bak_path))
-
-        os.replace(tmp_path, str(path))
-    except BaseException:
-        if fd >= 0:
-            os.close(fd)
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        raise
+        write(b"\n    ")
+        if row.tu_element is None and not row.extra_tuvs:
+            # New row (e.g., from split): escape the text straight into markup
+            source = _escape_text(row.source)
+            target = _escape_text(row.target)
+            write(f"{tu_open}{source}{tu_middle}{target}{tu_close}".encode("utf-8"))
+            continue
+        if row.tu_element is not None and not (row.source_modified or row.target_modified):
+            tu = row.tu_element
+        else:
+            tu = _build_tu_from_row(row, doc.source_lang, doc.target_lang)
+        write(etree.tostring(tu, encoding="UTF-8", with_tail=False))
+    write(b"\n  </body>\n</tmx>\n")
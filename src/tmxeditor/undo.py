@@ -7,10 +7,15 @@ and the caller is responsible for signalling the table model to refresh.
 
 All commands include pre-condition assertions to detect undo-stack
 corruption early rather than silently corrupting data.
+
+``affected_cells()`` tells the caller which ``(row, col)`` cells had
+their text changed by the last redo/undo.  Inserted and removed rows are
+not listed: the document announces those itself (see ``RowListener``).
 """
 
 from __future__ import annotations
 
+from array import array
 from typing import TYPE_CHECKING
 
 from PySide6.QtGui import QUndoCommand
@@ -54,6 +59,11 @@ class SplitCommand(QUndoCommand):
         """Whether the split filled an existing blank cell (vs inserting a row)."""
         return self._filled_existing
 
+    def affected_cells(self) -> list[tuple[int, int]]:
+        if not self._filled_existing:
+            return [(self._row, self._col)]
+        return [(self._row, self._col), (self._row + 1, self._col)]
+
     def redo(self) -> None:
         from tmxeditor.models import AlignmentRow
 
@@ -136,6 +146,11 @@ class MergeCommand(QUndoCommand):
         self._row_removed: bool = False
         self._removed_row: AlignmentRow | None = None
 
+    def affected_cells(self) -> list[tuple[int, int]]:
+        if self._row_removed:
+            return [(self._row, self._col)]
+        return [(self._row, self._col), (self._row + 1, self._col)]
+
     def redo(self) -> None:
         # Pre-condition check
         actual = self._doc.get_cell(self._row, self._col)
@@ -202,6 +217,9 @@ class MoveCellCommand(QUndoCommand):
         self._col = col
         self._direction = direction
 
+    def affected_cells(self) -> list[tuple[int, int]]:
+        return [(self._row, self._col), (self._row + self._direction, self._col)]
+
     def redo(self) -> None:
         target = self._row + self._direction
         a = self._doc.get_cell(self._row, self._col)
@@ -217,8 +235,36 @@ class MoveCellCommand(QUndoCommand):
         self._doc.set_cell(target, self._col, a)
 
 
+def _common_prefix_len(a: str, b: str) -> int:
+    """Length of the common prefix of *a* and *b* (slice compares run in C)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _text_delta(old: str, new: str) -> tuple[int, str, str]:
+    """Return ``(start, old_middle, new_middle)`` for the span that differs.
+
+    ``old == old[:start] + old_middle + tail`` and
+    ``new == new[:start] + new_middle + tail`` for a shared *tail*.
+    """
+    start = _common_prefix_len(old, new)
+    old_rest, new_rest = old[start:], new[start:]
+    tail = _common_prefix_len(old_rest[::-1], new_rest[::-1])
+    return start, old_rest[: len(old_rest) - tail], new_rest[: len(new_rest) - tail]
+
+
 class EditCellCommand(QUndoCommand):
-    """Replace cell text (after user confirms in edit dialog)."""
+    """Replace cell text (after user confirms in edit dialog).
+
+    Only the changed span is kept, not two full copies of the cell, so a
+    small fix in a long segment costs a few bytes of undo history.
+    """
 
     def __init__(
         self,
@@ -234,19 +280,89 @@ class EditCellCommand(QUndoCommand):
         self._doc = doc
         self._row = row
         self._col = col
-        self._old = old_text
-        self._new = new_text
+        self._old_len = len(old_text)
+        self._start, self._old_mid, self._new_mid = _text_delta(old_text, new_text)
+
+    def affected_cells(self) -> list[tuple[int, int]]:
+        return [(self._row, self._col)]
 
     def redo(self) -> None:
         actual = self._doc.get_cell(self._row, self._col)
-        assert actual == self._old, (
+        start, end = self._start, self._start + len(self._old_mid)
+        assert len(actual) == self._old_len and actual[start:end] == self._old_mid, (
             f"Edit integrity: row {self._row} col {self._col} "
-            f"expected '{self._old}', got '{actual}'"
+            f"expected '{self._old_mid}' at {start}, got '{actual}'"
         )
-        self._doc.set_cell(self._row, self._col, self._new)
+        self._doc.set_cell(self._row, self._col, actual[:start] + self._new_mid + actual[end:])
+
+    def undo(self) -> None:
+        actual = self._doc.get_cell(self._row, self._col)
+        start, end = self._start, self._start + len(self._new_mid)
+        self._doc.set_cell(self._row, self._col, actual[:start] + self._old_mid + actual[end:])
+
+
+class BulkEditCommand(QUndoCommand):
+    """Apply a batch of cell edits (e.g. Replace All) as one undo step.
+
+    *edits* is a list of ``(row, col, old_text, new_text)`` tuples.  Like
+    ``EditCellCommand`` only the changed span of each cell is kept; the
+    spans go into a shared string pool, so a replacement repeated across
+    thousands of cells is stored once, and the per-edit bookkeeping is a
+    flat array of ints rather than one Python object per edit.
+    """
+
+    _STRIDE = 6  # row, col, old length, start, old span ref, new span ref
+
+    def __init__(
+        self,
+        doc: AlignmentDocument,
+        edits: list[tuple[int, int, str, str]],
+        *,
+        description: str = "Edit cells",
+    ) -> None:
+        super().__init__(description)
+        self._doc = doc
+        pool: list[str] = []
+        refs: dict[str, int] = {}
+
+        def ref(text: str) -> int:
+            idx = refs.get(text)
+            if idx is None:
+                idx = refs[text] = len(pool)
+                pool.append(text)
+            return idx
+
+        fields = array("q")
+        for row, col, old, new in edits:
+            start, old_mid, new_mid = _text_delta(old, new)
+            fields.extend((row, col, len(old), start, ref(old_mid), ref(new_mid)))
+        self._pool = pool
+        self._fields = fields
+
+    def affected_cells(self) -> list[tuple[int, int]]:
+        f = self._fields
+        return list(zip(f[0 :: self._STRIDE], f[1 :: self._STRIDE]))
+
+    def redo(self) -> None:
+        doc, pool, f = self._doc, self._pool, self._fields
+        for i in range(0, len(f), self._STRIDE):
+            row, col, old_len, start, old_ref, new_ref = f[i : i + self._STRIDE]
+            old_mid = pool[old_ref]
+            end = start + len(old_mid)
+            actual = doc.get_cell(row, col)
+            assert len(actual) == old_len and actual[start:end] == old_mid, (
+                f"Bulk edit integrity: row {row} col {col} "
+                f"expected '{old_mid}' at {start}, got '{actual}'"
+            )
+            doc.set_cell(row, col, actual[:start] + pool[new_ref] + actual[end:])
 
     def undo(self) -> None:
-        self._doc.set_cell(self._row, self._col, self._old)
+        doc, pool, f = self._doc, self._pool, self._fields
+        for i in range(len(f) - self._STRIDE, -1, -self._STRIDE):
+            row, col, _old_len, start, old_ref, new_ref = f[i : i + self._STRIDE]
+            end = start + len(pool[new_ref])
+            actual = doc.get_cell(row, col)
+            doc.set_cell(row, col, actual[:start] + pool[old_ref] + actual[end:])
 
 
 class DeleteEmptyRowCommand(QUndoCommand):
@@ -264,6 +380,9 @@ class DeleteEmptyRowCommand(QUndoCommand):
         self._row = row
         self._removed_row: AlignmentRow | None = None
 
+    def affected_cells(self) -> list[tuple[int, int]]:
+        return []
+
     def redo(self) -> None:
         # Pre-condition: both cells must be empty
         src = self._doc.get_cell(self._row, 0)
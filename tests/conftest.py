@@ -6,12 +6,26 @@ from pathlib import Path
 
 import pytest
 
+from tmxeditor import config
 from tmxeditor.models import AlignmentDocument, AlignmentRow
 from tmxeditor.tmx_io import parse_tmx
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path: Path):
+    """Point the user config files at a temp dir so tests never touch ~/.tmxeditor."""
+    config_dir = tmp_path / "config"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(config, "_USER_CONFIG_DIR", config_dir)
+        mp.setattr(config, "_USER_SETTINGS_PATH", config_dir / "settings.json")
+        mp.setattr(config, "_USER_SHORTCUTS_PATH", config_dir / "shortcuts.json")
+        config.reload()
+        yield config_dir
+        config.reload()  # drop whatever the test left in memory
+
+
 @pytest.fixture
 def small_tmx_path() -> Path:
     return FIXTURES_DIR / "small.tmx"
@@ -0,0 +1,28 @@
+"""Tests for the background task runner (run synchronously here)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tmxeditor.background import BackgroundTask
+from tmxeditor.tmx_io import parse_tmx
+
+
+class TestBackgroundTask:
+    def test_result_reported(self, small_tmx_path: Path):
+        results, errors = [], []
+        task = BackgroundTask(parse_tmx, small_tmx_path)
+        task.signals.finished.connect(results.append)
+        task.signals.failed.connect(errors.append)
+        task.run()
+        assert not errors
+        assert results[0].row_count() == 5
+
+    def test_exception_reported(self, malformed_tmx_path: Path):
+        results, errors = [], []
+        task = BackgroundTask(parse_tmx, malformed_tmx_path)
+        task.signals.finished.connect(results.append)
+        task.signals.failed.connect(errors.append)
+        task.run()
+        assert not results
+        assert isinstance(errors[0], Exception)
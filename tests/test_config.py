@@ -42,3 +42,94 @@ class TestConfig:
         assert isinstance(config.ACTION_LABELS, dict)
         assert "file_open" in config.ACTION_LABELS
         assert "op_split" in config.ACTION_LABELS
+
+    def test_defaults_parsed_once(self):
+        assert config._load_defaults() is config._load_defaults()
+
+    def test_read_json_cached_until_mtime_changes(self, tmp_path):
+        import os
+
+        p = tmp_path / "settings.json"
+        p.write_text('{"a": 1}', encoding="utf-8")
+        os.utime(p, (1_000_000, 1_000_000))
+        first = config._read_json(p)
+        assert config._read_json(p) is first
+
+        p.write_text('{"a": 2}', encoding="utf-8")
+        os.utime(p, (2_000_000, 2_000_000))
+        assert config._read_json(p) == {"a": 2}
+
+    def test_save_settings_atomic(self, tmp_path, monkeypatch):
+        import json
+
+        settings_path = tmp_path / "settings.json"
+        monkeypatch.setattr(config, "_USER_CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config, "_USER_SETTINGS_PATH", settings_path)
+        shortcuts = config.get_shortcuts()
+        config.save_settings()
+        data = json.loads(settings_path.read_text(encoding="utf-8"))
+        assert data["shortcuts"] == shortcuts
+        # No temp files left behind
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+    def test_set_shortcuts_invalidates_lookup(self):
+        original = config.get_shortcut("op_merge")
+        config.set_shortcuts({"op_merge": "Ctrl+Shift+M"})
+        assert config.get_shortcut("op_merge") == "Ctrl+Shift+M"
+        # Reset
+        config.set_shortcuts({"op_merge": original})
+        assert config.get_shortcut("op_merge") == original
+
+    def test_keysequence_cached_and_invalidated(self):
+        original = config.get_shortcut("op_merge")
+        seq = config.get_keysequence("op_merge")
+        assert config.get_keysequence("op_merge") is seq
+        config.set_shortcuts({"op_merge": "Ctrl+Shift+M"})
+        assert config.get_keysequence("op_merge").toString() == "Ctrl+Shift+M"
+        # Reset
+        config.set_shortcuts({"op_merge": original})
+
+    def test_display_settings_loaded(self, tmp_path, monkeypatch):
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text('{"display": {"word_wrap": false}}', encoding="utf-8")
+        monkeypatch.setattr(config, "_USER_SETTINGS_PATH", settings_path)
+        config.reload()
+        assert config.get_display("word_wrap", True) is False
+        assert config.get_display("column_ratio") == 0.5
+        # Reset
+        monkeypatch.undo()
+        config.reload()
+
+    def test_legacy_shortcuts_migrated_once(self, tmp_path, monkeypatch):
+        import json
+
+        legacy = tmp_path / "shortcuts.json"
+        legacy.write_text('{"op_split": "Ctrl+Shift+T"}', encoding="utf-8")
+        monkeypatch.setattr(config, "_USER_CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config, "_USER_SETTINGS_PATH", tmp_path / "settings.json")
+        monkeypatch.setattr(config, "_USER_SHORTCUTS_PATH", legacy)
+        config.reload()
+        assert config.get_shortcut("op_split") == "Ctrl+Shift+T"
+        assert not legacy.exists()
+        data = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+        assert data["shortcuts"] == {"op_split": "Ctrl+Shift+T"}
+        # Reset
+        monkeypatch.undo()
+        config.reload()
+
+    def test_legacy_migration_tolerates_readonly_dir(self, tmp_path, monkeypatch):
+        legacy = tmp_path / "shortcuts.json"
+        legacy.write_text('{"op_split": "Ctrl+Shift+T"}', encoding="utf-8")
+        monkeypatch.setattr(config, "_USER_SETTINGS_PATH", tmp_path / "settings.json")
+        monkeypatch.setattr(config, "_USER_SHORTCUTS_PATH", legacy)
+
+        def fail(_data):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(config, "_write_settings", fail)
+        config.reload()
+        assert config.get_shortcut("op_split") == "Ctrl+Shift+T"
+        assert legacy.exists()
+        # Reset
+        monkeypatch.undo()
+        config.reload()
@@ -146,3 +146,34 @@ class TestModifiedTracking:
         for row in sample_doc.rows:
             assert not row.source_modified
             assert not row.target_modified
+
+
+class TestRowListener:
+    """insert_row/remove_row bracket the change for the table model."""
+
+    class _Recorder:
+        def __init__(self, doc: AlignmentDocument):
+            self.doc = doc
+            self.events: list[tuple[str, int]] = []
+
+        def begin_insert_row(self, index: int) -> None:
+            self.events.append(("begin_insert", self.doc.row_count()))
+
+        def end_insert_row(self) -> None:
+            self.events.append(("end_insert", self.doc.row_count()))
+
+        def begin_remove_row(self, index: int) -> None:
+            self.events.append(("begin_remove", self.doc.row_count()))
+
+        def end_remove_row(self) -> None:
+            self.events.append(("end_remove", self.doc.row_count()))
+
+    def test_listener_brackets_structural_edits(self, sample_doc: AlignmentDocument):
+        recorder = self._Recorder(sample_doc)
+        sample_doc.row_listener = recorder
+        sample_doc.insert_row(1, AlignmentRow(source="x", target="y"))
+        sample_doc.remove_row(1)
+        assert recorder.events == [
+            ("begin_insert", 4), ("end_insert", 5),
+            ("begin_remove", 5), ("end_remove", 4),
+        ]
@@ -0,0 +1,92 @@
+"""Tests for the Find index."""
+
+from __future__ import annotations
+
+import re
+
+from tmxeditor.models import AlignmentDocument, AlignmentRow
+from tmxeditor.search import FindIndex
+
+
+def _make_doc() -> AlignmentDocument:
+    return AlignmentDocument(
+        rows=[
+            AlignmentRow(source="Hello world", target="Bonjour le monde"),
+            AlignmentRow(source="Good morning", target="Bonjour"),
+            AlignmentRow(source="", target="Merci"),
+            AlignmentRow(source="hello again", target="Rebonjour"),
+        ],
+        source_lang="en",
+        target_lang="fr",
+    )
+
+
+class TestFindIndex:
+    def test_forward_from_current_cell(self):
+        index = FindIndex(_make_doc())
+        assert index.find("bonjour", 0, 0) == (0, 1)
+        assert index.find("bonjour", 0, 1) == (1, 1)
+        assert index.find("bonjour", 1, 1) == (3, 1)
+
+    def test_forward_wraps_to_start(self):
+        index = FindIndex(_make_doc())
+        assert index.find("hello", 3, 0) == (0, 0)
+        assert index.find("monde", 3, 1) == (0, 1)
+
+    def test_backward_and_wrap(self):
+        index = FindIndex(_make_doc())
+        assert index.find("bonjour", 3, 1, forward=False) == (1, 1)
+        assert index.find("hello", 0, 0, forward=False) == (3, 0)
+
+    def test_case_sensitive(self):
+        index = FindIndex(_make_doc())
+        assert index.find("hello", 0, 0, case_sensitive=True) == (3, 0)
+        assert index.find("HELLO", 0, 0, case_sensitive=True) is None
+        assert index.find("HELLO", 0, 0) == (3, 0)
+
+    def test_match_only_in_current_cell_found_last(self):
+        index = FindIndex(_make_doc())
+        assert index.find("merci", 2, 1) == (2, 1)
+        assert index.find("merci", 2, 1, forward=False) == (2, 1)
+
+    def test_no_match_across_cells(self):
+        index = FindIndex(_make_doc())
+        assert index.find("mondeGood", 0, 0) is None
+        assert index.find("missing", 0, 0) is None
+
+    def test_case_folding_that_changes_length(self):
+        # "İ".lower() is two code points; offsets must still line up
+        doc = AlignmentDocument(
+            rows=[
+                AlignmentRow(source="İİİ", target="a"),
+                AlignmentRow(source="b", target="target"),
+            ],
+        )
+        index = FindIndex(doc)
+        assert index.find("target", 0, 0) == (1, 1)
+
+    def test_empty_document(self):
+        assert FindIndex(AlignmentDocument()).find("x", 0, 0) is None
+
+    def test_refresh_cells_after_text_edit(self):
+        doc = _make_doc()
+        index = FindIndex(doc)
+        assert index.find("merci", 0, 0) == (2, 1)
+        doc.set_cell(0, 0, "Merci beaucoup")
+        assert index.refresh_cells([(0, 0)])
+        assert index.find("merci", 3, 1) == (0, 0)
+        assert index.find("hello", 1, 0) == (3, 0)
+
+    def test_refresh_cells_rejects_row_changes(self):
+        doc = _make_doc()
+        index = FindIndex(doc)
+        doc.remove_row(2)
+        assert not index.refresh_cells([(0, 0)])
+
+    def test_matching_cells(self):
+        index = FindIndex(_make_doc())
+        pattern = re.compile(re.escape("bonjour"), re.IGNORECASE)
+        # "Rebonjour" matches mid-cell; each cell is listed once
+        assert index.matching_cells(pattern) == [(0, 1), (1, 1), (3, 1)]
+        assert index.matching_cells(re.compile("Merci")) == [(2, 1)]
+        assert index.matching_cells(re.compile("xyz")) == []
@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from lxml import etree
 
-from tmxeditor.models import AlignmentDocument
+from tmxeditor.models import AlignmentDocument, AlignmentRow
 from tmxeditor.tmx_io import parse_tmx, write_tmx
 
 
@@ -48,6 +48,17 @@ class TestParsing:
         with pytest.raises(etree.XMLSyntaxError):
             parse_tmx(malformed_tmx_path)
 
+    def test_blank_text_between_inline_tags_kept(self, tmp_path: Path):
+        path = tmp_path / "inline.tmx"
+        path.write_text(
+            '<tmx version="1.4"><header srclang="en"/><body><tu>'
+            '<tuv xml:lang="en"><seg><bpt i="1">&lt;b&gt;</bpt> <ept i="1">&lt;/b&gt;</ept></seg></tuv>'
+            '<tuv xml:lang="th"><seg>x</seg></tuv>'
+            "</tu></body></tmx>",
+            encoding="utf-8",
+        )
+        assert parse_tmx(path).rows[0].source == "<b> </b>"
+
 
 class TestRoundTrip:
     def test_parse_save_reparse(self, small_doc: AlignmentDocument, tmp_path: Path):
@@ -82,6 +93,49 @@ class TestRoundTrip:
         assert root.tag == "tmx"
         assert root.get("version") == "1.4"
 
+    def test_unmodified_tu_written_verbatim(self, metadata_tmx_path: Path, tmp_path: Path):
+        doc = parse_tmx(metadata_tmx_path)
+        doc.set_cell(0, 1, "changed")
+        doc.insert_row(1, AlignmentRow(source="new", target="ใหม่"))
+        out = tmp_path / "mixed.tmx"
+        write_tmx(doc, out, backup=False)
+
+        written = out.read_bytes()
+        original = etree.tostring(doc.rows[2].tu_element, encoding="UTF-8", with_tail=False)
+        assert original in written
+        doc2 = parse_tmx(out)
+        assert [r.source for r in doc2.rows] == [
+            "Hello world", "new", "Click <b>here</b> to continue", "Multilingual",
+        ]
+        assert doc2.rows[0].target == "changed"
+
+    def test_new_row_text_escaped(self, tmp_path: Path):
+        doc = AlignmentDocument(
+            rows=[AlignmentRow(source='Fish & <chips> "to go"\r\n', target="ปลา > มันฝรั่ง")],
+            source_lang="en",
+            target_lang="th",
+        )
+        out = tmp_path / "escaped.tmx"
+        write_tmx(doc, out, backup=False)
+        doc2 = parse_tmx(out)
+        assert doc2.rows[0].source == doc.rows[0].source
+        assert doc2.rows[0].target == doc.rows[0].target
+
+    def test_control_characters_rejected(self, small_doc: AlignmentDocument, tmp_path: Path):
+        # New rows and edited parsed rows fail the same way instead of
+        # silently losing text
+        new = AlignmentDocument(
+            rows=[AlignmentRow(source="bell\x07", target="")],
+            source_lang="en",
+            target_lang="th",
+        )
+        with pytest.raises(ValueError):
+            write_tmx(new, tmp_path / "new.tmx", backup=False)
+        small_doc.rows[0].source = "bell\x07"
+        small_doc.rows[0].source_modified = True
+        with pytest.raises(ValueError):
+            write_tmx(small_doc, tmp_path / "edited.tmx", backup=False)
+
     def test_backup_created(self, small_doc: AlignmentDocument, tmp_path: Path):
         out = tmp_path / "backup_test.tmx"
         # First save — no backup needed (file doesn't exist yet)
@@ -94,6 +148,24 @@ class TestRoundTrip:
         write_tmx(small_doc, out, backup=True)
         assert bak.exists()
 
+    def test_backup_keeps_previous_version(
+        self, small_doc: AlignmentDocument, tmp_path: Path
+    ):
+        out = tmp_path / "backup_test.tmx"
+        write_tmx(small_doc, out, backup=True)
+        first = out.read_bytes()
+
+        small_doc.set_cell(0, 0, "Changed")
+        write_tmx(small_doc, out, backup=True)
+        bak = out.with_suffix(".tmx.bak")
+        assert bak.read_bytes() == first
+        assert parse_tmx(out).rows[0].source == "Changed"
+
+        # A third save replaces the old backup with the second version
+        second = out.read_bytes()
+        write_tmx(small_doc, out, backup=True)
+        assert bak.read_bytes() == second
+
     def test_unicode_round_trip_thai(self, tmp_path: Path):
         from tmxeditor.models import AlignmentRow
 
@@ -6,6 +6,7 @@ from PySide6.QtGui import QUndoStack
 
 from tmxeditor.models import AlignmentDocument, AlignmentRow
 from tmxeditor.undo import (
+    BulkEditCommand,
     DeleteEmptyRowCommand,
     EditCellCommand,
     MergeCommand,
@@ -268,6 +269,59 @@ class TestEditUndoRedo:
         stack.redo()
         assert doc.get_cell(0, 0) == "New text"
 
+    def test_edit_stores_only_changed_span(self):
+        long_text = "word " * 2000
+        doc = AlignmentDocument(rows=[AlignmentRow(source=long_text, target="")])
+        stack = QUndoStack()
+        new_text = long_text[:5000] + "WORD" + long_text[5004:]
+        cmd = EditCellCommand(doc, 0, 0, long_text, new_text)
+        stack.push(cmd)
+        assert doc.get_cell(0, 0) == new_text
+        assert len(cmd._old_mid) + len(cmd._new_mid) <= 8
+        stack.undo()
+        assert doc.get_cell(0, 0) == long_text
+
+
+# ── Bulk Edit ───────────────────────────────────────────────────
+
+
+class TestBulkEditUndoRedo:
+    def test_replace_all_single_step(self):
+        doc = _make_doc()
+        stack = QUndoStack()
+        edits = [
+            (0, 0, "Alpha one two", "Alpha 1 two"),
+            (2, 0, "Gamma four", "Gamma 4"),
+        ]
+        stack.push(BulkEditCommand(doc, edits))
+        assert stack.count() == 1
+        assert doc.get_cell(0, 0) == "Alpha 1 two"
+        assert doc.get_cell(2, 0) == "Gamma 4"
+
+        stack.undo()
+        assert doc.get_cell(0, 0) == "Alpha one two"
+        assert doc.get_cell(2, 0) == "Gamma four"
+
+        stack.redo()
+        assert doc.get_cell(2, 0) == "Gamma 4"
+
+    def test_repeated_spans_pooled(self):
+        doc = AlignmentDocument(
+            rows=[AlignmentRow(source=f"cat {i}", target="") for i in range(50)],
+            source_lang="en",
+            target_lang="th",
+        )
+        edits = [(i, 0, f"cat {i}", f"dog {i}") for i in range(50)]
+        cmd = BulkEditCommand(doc, edits)
+        assert cmd._pool == ["cat", "dog"]
+
+        stack = QUndoStack()
+        stack.push(cmd)
+        assert doc.get_cell(49, 0) == "dog 49"
+        assert cmd.affected_cells()[:2] == [(0, 0), (1, 0)]
+        stack.undo()
+        assert doc.get_cell(49, 0) == "cat 49"
+
 
 # ── Delete Empty Row ────────────────────────────────────────────
 
@@ -392,3 +446,48 @@ class TestSequences:
 
         for i in range(4):
             assert doc.get_cell(i, 0) == originals[i]
+
+    def test_multiple_cell_moves_in_macro_undo_at_once(self):
+        doc = _make_doc()
+        stack = QUndoStack()
+        originals = [doc.get_cell(i, 0) for i in range(4)]
+
+        stack.beginMacro("Move cells")
+        stack.push(MoveCellCommand(doc, 0, 0, 1))
+        stack.push(MoveCellCommand(doc, 1, 0, 1))
+        stack.push(MoveCellCommand(doc, 2, 0, 1))
+        stack.endMacro()
+        assert stack.count() == 1
+        moved = [doc.get_cell(i, 0) for i in range(4)]
+
+        stack.undo()
+        for i in range(4):
+            assert doc.get_cell(i, 0) == originals[i]
+
+        stack.redo()
+        for i in range(4):
+            assert doc.get_cell(i, 0) == moved[i]
+
+
+# ── Refresh hints ──────────────────────────────────────────────
+
+
+class TestAffectedCells:
+    def test_text_only_commands_report_cells(self):
+        doc = _make_doc()
+        stack = QUndoStack()
+        edit = EditCellCommand(doc, 1, 1, doc.get_cell(1, 1), "x")
+        move = MoveCellCommand(doc, 2, 0, -1)
+        stack.push(edit)
+        stack.push(move)
+        assert edit.affected_cells() == [(1, 1)]
+        assert move.affected_cells() == [(2, 0), (1, 0)]
+
+    def test_structural_commands_omit_inserted_rows(self):
+        doc = _make_doc()
+        stack = QUndoStack()
+        split = SplitCommand(doc, row=0, col=0, pos=6)
+        stack.push(split)
+        assert split.affected_cells() == [(0, 0)]
+        stack.undo()
+        assert split.affected_cells() == [(0, 0)]